@@ -4,54 +4,27 @@ pitcher_data = pitching_stats(2025,2025)
 from pybaseball import batting_stats
 hitter_data = batting_stats(2025,2025)
 #print(list(hitter_data.columns))
-pitcher_categories = ['Name', 'W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD','IP']
-pitcher_data_categories = pitcher_data[pitcher_categories]
-pitcher_data_filtered = pitcher_data_categories[pitcher_data_categories['IP'] > 0]
-#print(pitcher_data_filtered)
-pitcher_stats_mean = pitcher_data_filtered.drop(columns=['Name']).mean()
-pitcher_stats_std = pitcher_data_filtered.drop(columns=['Name']).std()
-#print("Mean values:\n", pitcher_stats_mean)
-#print("\nStandard Deviation:\n", pitcher_stats_std)
-numeric_columns = ['W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD']
-pitcher_z_scores = (pitcher_data_filtered[numeric_columns] - pitcher_stats_mean[numeric_columns]) / pitcher_stats_std[numeric_columns]
-pitcher_z_scores['ERA'] *= -1
-pitcher_z_scores['WHIP'] *= -1
-# Add 'Name' column back
-pitcher_z_scores.insert(0, 'Name', pitcher_data_filtered['Name'])
+from zscores import PITCHER_CATEGORIES, HITTER_CATEGORIES, PITCHER_VOLUME, HITTER_VOLUME, zscore_table, ranked
+
+# Same IP/PA-weighted z-scores as the app and the backend
+pitcher_z_scores = zscore_table(pitcher_data, PITCHER_CATEGORIES, PITCHER_VOLUME, id_columns=['Name'])
 
 # Print final Z-score table
 #print(pitcher_z_scores)
 
-hitter_categories = ['Name', 'R', 'HR', 'RBI', 'SB', 'AVG', 'PA']
-hitter_data_categories = hitter_data[hitter_categories]
-hitter_data_filtered = hitter_data_categories[hitter_data_categories['PA'] > 0]
-#print(hitter_data_filtered)
-hitter_stats_mean = hitter_data_filtered.drop(columns=['Name']).mean()
-hitter_stats_std = hitter_data_filtered.drop(columns=['Name']).std()
-numeric_columns = ['R', 'HR', 'RBI', 'SB', 'AVG']
-hitter_z_scores = (hitter_data_filtered[numeric_columns] - hitter_stats_mean[numeric_columns]) / hitter_stats_std[numeric_columns]
-
-# Add 'Name' column back
-hitter_z_scores.insert(0, 'Name', hitter_data_filtered['Name'])
+hitter_z_scores = zscore_table(hitter_data, HITTER_CATEGORIES, HITTER_VOLUME, id_columns=['Name'])
 
 # Print final Z-score table
 #print(hitter_z_scores)
-#print(hitter_data_categories)
-
-# Sum up all Z-scores (excluding 'Name')
-pitcher_z_scores['Total Z-Score'] = pitcher_z_scores.drop(columns=['Name']).sum(axis=1)
 
 # Sort the dataset by Total Z-Score in descending order
-pitcher_z_scores_ranked = pitcher_z_scores.sort_values(by='Total Z-Score', ascending=False)
+pitcher_z_scores_ranked = ranked(pitcher_z_scores)
 
 # Display the ranked dataset
 print(pitcher_z_scores_ranked)
 
-# Sum up all Z-scores (excluding 'Name')
-hitter_z_scores['Total Z-Score'] = hitter_z_scores.drop(columns=['Name']).sum(axis=1)
-
 # Sort the dataset by Total Z-Score in descending order
-hitter_z_scores_ranked = hitter_z_scores.sort_values(by='Total Z-Score', ascending=False)
+hitter_z_scores_ranked = ranked(hitter_z_scores)
 
 # Display the ranked dataset
 print(hitter_z_scores_ranked)
@@ -3,6 +3,10 @@ import pandas as pd
 from pybaseball import pitching_stats, batting_stats, pitching_stats_range, batting_stats_range
 from datetime import datetime, timedelta
 
+from roster_corrections import load_overrides, apply_corrections
+from fetch_orchestrator import fetch_all
+from zscores import PITCHER_CATEGORIES, HITTER_CATEGORIES, PITCHER_VOLUME, HITTER_VOLUME, zscore_table, ranked
+
 # --- Season and Timeframe Dropdown ---
 season_options = ["2025", "2024", "2023", "Last Week", "Last 2 Weeks", "Last Month"]
 selected_season = st.sidebar.selectbox("Select Season or Timeframe:", season_options)
@@ -18,186 +22,52 @@ elif selected_season == "Last Month":
 else:
     start_date = None  # For full season
 
-# --- Fetch Data ---
+# --- Fetch Data (pitching and batting concurrently) ---
 if start_date is None:
-    pitcher_dat = pitching_stats(int(selected_season), int(selected_season), qual=0)
-    hitter_dat = batting_stats(int(selected_season), int(selected_season), qual=0)
+    fetched = fetch_all({
+        'pitching': lambda: pitching_stats(int(selected_season), int(selected_season), qual=0),
+        'batting': lambda: batting_stats(int(selected_season), int(selected_season), qual=0),
+    })
 else:
     start_str = start_date.strftime("%Y-%m-%d")
     end_str = end_date.strftime("%Y-%m-%d")
-    pitcher_dat = pitching_stats_range(start_str, end_str)
-    hitter_dat = batting_stats_range(start_str, end_str)
+    fetched = fetch_all({
+        'pitching': lambda: pitching_stats_range(start_str, end_str),
+        'batting': lambda: batting_stats_range(start_str, end_str),
+    })
+pitcher_dat, hitter_dat = fetched['pitching'], fetched['batting']
 
 pitcher_positions = pd.read_csv(r"C:\Users\dmuin\Downloads\pythoncode\pitcher_positions.csv")
 pitcher_positions.rename(columns={'ESPN': 'Pos'}, inplace=True)
 
-# Changes to pitcher_dat
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Alexis Diaz') & (pitcher_dat['Team'] == 'CIN'), 'Team'] = 'LAD'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Ian Anderson') & (pitcher_dat['Team'] == 'LAA'), 'Team'] = 'ATL'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Jason Alexander') & (pitcher_dat['Team'] == 'ATH'), 'Team'] = 'HOU'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Josh Walker') & (pitcher_dat['Team'] == 'TOR'), 'Team'] = 'PHI'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Kenta Maeda') & (pitcher_dat['Team'] == 'DET'), 'Team'] = 'CHC'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Kevin Herget') & (pitcher_dat['Team'] == 'NYM'), 'Team'] = 'ATL'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Kyle Gibson') & (pitcher_dat['Team'] == 'BAL'), 'Team'] = 'TBR'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Matt Krook') & (pitcher_dat['Team'] == 'ATH'), 'Team'] = 'CLE'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Noah Murdock') & (pitcher_dat['Team'] == 'ATH'), 'Team'] = 'KCR'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Michael Fulmer') & (pitcher_dat['Team'] == 'BOS'), 'Team'] = 'CHC'#
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Tayler Scott') & (pitcher_dat['Team'] == 'HOU'), 'Team'] = 'ARI'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Tyler Matzek') & (pitcher_dat['Team'] == 'NYY'), 'Team'] = 'STL'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Colin Poche') & (pitcher_dat['Team'] == 'WSN'), 'Team'] = 'NYM'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Lucas Sims') & (pitcher_dat['Team'] == 'WSN'), 'Team'] = 'PHI'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Casey Lawrence') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'SEA'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Hector Neris') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'LAA'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Jose Castillo') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'NYM'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Jose Urena') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'LAD'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Lou Trivino') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'LAD'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Rafael Montero') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'ATL'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Scott Blewett') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'ATL'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Sean Newcomb') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'ATH'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Yoendrys Gomez') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'CHW'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Genesis Cabrera') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'CHC'
-
-
-# Changes to pitcher_positions
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Carl Edwards Jr.') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'CHC'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Brooks Kriske') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'LAA'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Cody Bolton') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'CLE'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Joe Mantiply') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'ARI'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Jose Ruiz') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'PHI'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Julian Merryweather') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'CHC'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Tanner Rainey') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'PIT'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Triston McKenzie') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'CLE'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Tyler Alexander') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'MIL'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Xzavion Curry') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'MIA'
-
-
-team_replacements_pitcher = {
-    'WSH': 'WSN',#
-    'CWS': 'CHW',
-    'TB': 'TBR',#
-    'SD': 'SDP',#
-    'SF': 'SFG',#
-    'KC': 'KCR',#
-}
-pitcher_positions['Team'] = pitcher_positions['Team'].replace(team_replacements_pitcher)
-
-name_replacements_pitcher = {
-    'AJ Blubaugh': 'A.J. Blubaugh',
-    'Jack Dreyer': 'Jacob Dreyer',
-    'Jake Eder': 'Jacob Eder',
-    'Jacob Latz': 'Jake Latz',
-    'Louis Varland': 'Louie Varland',
-    'Pat Monteverde': 'Patrick Monteverde',
-    "Riley Oâ€™Brien": "Riley O'Brien",
-    'Thomas Harrington': 'Tom Harrington',
-    'Yerry De los Santos': 'Yerry De Los Santos',
-    'Zach Agnos': 'Zachary Agnos',
-    'Brad Lord': 'Bradley Lord',
-    'Michael Soroka': 'Mike Soroka'
-}
-
-pitcher_positions['Name'] = pitcher_positions['Name'].replace(name_replacements_pitcher)
+# Trades, team code aliases and name fixes all live in roster_overrides.csv
+# A completed season should not pick up roster moves made after it ended
+corrections_as_of = end_date.date() if start_date is not None else min(end_date.date(), datetime(int(selected_season), 12, 31).date())
+overrides = load_overrides()
+pitcher_dat = apply_corrections(pitcher_dat, 'pitcher_stats', corrections_as_of, overrides)
+pitcher_positions = apply_corrections(pitcher_positions, 'pitcher_positions', corrections_as_of, overrides)
 
 pitcher_data = pd.merge(pitcher_dat, pitcher_positions[['Name', 'Team', 'Pos']], on = ['Name', 'Team'], how = 'left')
 pitcher_dat.to_csv(r"C:\Users\dmuin\Downloads\pythoncode\raw.csv")
 pitcher_positions.to_csv(r"C:\Users\dmuin\Downloads\pythoncode\test.csv")
 pitcher_data.to_csv(r"C:\Users\dmuin\Downloads\pythoncode\diw.csv")
 
-#Replace Teams: WSH with WSN, CWS with CHW, TB with TBR, SD with SDP, SF with SFG, KC with KCR, 
-#Replace Ben Williamson with Benjamin Williamson, Bobby Witt with Bobby Witt Jr., CJ Alexander with C.J. Alexander
-#Replace DaShawn Keirsey with DaShawn Keirsey Jr., Jackson Chourio with Jazz Chisholm Jr., Leo Rivas with Leonardo Rivas
-#Replace Lourdes Gurriel with Lourdes Gurriel Jr., Michael Harris with Michael Harris II, Nick Kurtz with Nicholas Kurtz
-#Replace Ronald Acuna with Ronald Acuna Jr., Victor Scott with Victor Scott II, Vladimir Guerrero with Vladimir Guerrero Jr., 
-#Replace Vladimir Guerrero with Vladimir Guerrero Jr., Zach Dezenzo with Zachary Dezenzo
 hitter_positions = pd.read_csv(r"C:\Users\dmuin\Downloads\pythoncode\Player Positions.csv")
-name_mistakes_hitter = {
-    'Jack WInkler': 'Jack Winkler',
-
-}
-hitter_dat['Name'] = hitter_dat['Name'].replace(name_mistakes_hitter)
-team_replacements_hitter = {
-    'WSH': 'WSN',
-    'CWS': 'CHW',
-    'TB': 'TBR',
-    'SD': 'SDP',
-    'SF': 'SFG',
-    'KC': 'KCR',
-}
-hitter_positions['Team'] = hitter_positions['Team'].replace(team_replacements_hitter)
-# Replace player names
-name_replacements_hitter = {
-    'Ben Williamson': 'Benjamin Williamson',
-    'Bobby Witt': 'Bobby Witt Jr.',
-    'CJ Alexander': 'C.J. Alexander',
-    'DaShawn Keirsey': 'DaShawn Keirsey Jr.',
-    'Leo Rivas': 'Leonardo Rivas',
-    'Lourdes Gurriel': 'Lourdes Gurriel Jr.',
-    'Michael Harris': 'Michael Harris II',
-    'Nick Kurtz': 'Nicholas Kurtz',
-    'Ronald Acuna': 'Ronald Acuna Jr.',
-    'Victor Scott': 'Victor Scott II',
-    'Vladimir Guerrero': 'Vladimir Guerrero Jr.',
-    'Zach Dezenzo': 'Zachary Dezenzo',
-    'Fernando Tatis': 'Fernando Tatis Jr.',
-    'LaMonte Wade': 'LaMonte Wade Jr.',
-    'Luis Garcia': 'Luis Garcia Jr.',
-    'Luis Robert': 'Luis Robert Jr.',
-    'Michael Taylor': 'Michael A. Taylor',
-    'Robert Hassell': 'Robert Hassell III',
-    'Jazz Chisholm': 'Jazz Chisholm Jr.',
-    'Tim Elko': 'Timothy Elko'
-}
-
-hitter_positions['Name'] = hitter_positions['Name'].replace(name_replacements_hitter)
+hitter_dat = apply_corrections(hitter_dat, 'hitter_stats', corrections_as_of, overrides)
+hitter_positions = apply_corrections(hitter_positions, 'hitter_positions', corrections_as_of, overrides)
 
 hitter_data = pd.merge(hitter_dat, hitter_positions[['Name', 'Team', 'Pos']], on = ['Name', 'Team'], how = 'left')
 hitter_data.rename(columns={'Pos_y': 'Pos'}, inplace=True)
 
-# --- Pitcher Z-Scores ---
-pitcher_categories = ['Name','Team', 'Pos', 'W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD','IP']
-pitcher_data_categories = pitcher_data[pitcher_categories]
-pitcher_data_filtered = pitcher_data_categories[pitcher_data_categories['IP'] > 0]
-pitcher_stats_mean = pitcher_data_filtered.drop(columns=['Name','Team', 'Pos',]).mean()
-pitcher_stats_std = pitcher_data_filtered.drop(columns=['Name','Team', 'Pos',]).std()
-pitcher_numeric_columns = ['W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD']
-pitcher_z_scores = (pitcher_data_filtered[pitcher_numeric_columns] - pitcher_stats_mean[pitcher_numeric_columns]) / pitcher_stats_std[pitcher_numeric_columns]
-pitcher_data_filtered['Weighted_ERA'] = (pitcher_data_filtered['ERA'] - pitcher_stats_mean['ERA']) / (pitcher_stats_std['ERA'] / (pitcher_data_filtered['IP'] ** 0.5))
-pitcher_z_scores['ERA'] = (pitcher_data_filtered['Weighted_ERA'] - pitcher_data_filtered['Weighted_ERA'] .mean()) / pitcher_data_filtered['Weighted_ERA'] .std()
-pitcher_data_filtered['Weighted_WHIP'] = (pitcher_data_filtered['WHIP'] - pitcher_stats_mean['WHIP']) / (pitcher_stats_std['WHIP'] / (pitcher_data_filtered['IP'] ** 0.5))
-pitcher_z_scores['WHIP'] = (pitcher_data_filtered['Weighted_WHIP'] - pitcher_data_filtered['Weighted_WHIP'] .mean()) / pitcher_data_filtered['Weighted_WHIP'] .std()
-pitcher_z_scores['ERA'] *= -1
-pitcher_z_scores['WHIP'] *= -1
-pitcher_z_scores.insert(0, 'Name', pitcher_data_filtered['Name'])
-pitcher_z_scores.insert(1, 'Team', pitcher_data_filtered['Team'])
-pitcher_z_scores.insert(2, 'Pos', pitcher_data_filtered['Pos'])
-
-# --- Hitter Z-Scores ---
-hitter_categories = ['Name','Team', 'Pos', 'R', 'HR', 'RBI', 'SB', 'AVG', 'PA']
-hitter_data_categories = hitter_data[hitter_categories]
-hitter_data_filtered = hitter_data_categories[hitter_data_categories['PA'] > 0]
-hitter_stats_mean = hitter_data_filtered.drop(columns=['Name','Team', 'Pos']).mean()
-hitter_stats_std = hitter_data_filtered.drop(columns=['Name','Team', 'Pos']).std()
-hitter_numeric_columns = ['R', 'HR', 'RBI', 'SB', 'AVG']
-hitter_z_scores = (hitter_data_filtered[hitter_numeric_columns] - hitter_stats_mean[hitter_numeric_columns]) / hitter_stats_std[hitter_numeric_columns]
-hitter_data_filtered['Weighted_AVG'] = (hitter_data_filtered['AVG'] - hitter_stats_mean['AVG']) / (hitter_stats_std['AVG'] / (hitter_data_filtered['PA'] ** 0.5))
-hitter_z_scores['AVG'] = (hitter_data_filtered['Weighted_AVG'] - hitter_data_filtered['Weighted_AVG'] .mean()) / hitter_data_filtered['Weighted_AVG'] .std()
-hitter_z_scores.insert(0, 'Name', hitter_data_filtered['Name'])
-hitter_z_scores.insert(1, 'Team', hitter_data_filtered['Team'])
-hitter_z_scores.insert(2, 'Pos', hitter_data_filtered['Pos'])
-
-# --- Total Z-Scores ---
-pitcher_z_scores['Total Z-Score'] = pitcher_z_scores[pitcher_numeric_columns].sum(axis=1)
-hitter_z_scores['Total Z-Score'] = hitter_z_scores[hitter_numeric_columns].sum(axis=1)
+# --- Z-Scores (IP-weighted ERA/WHIP, PA-weighted AVG; see zscores.py) ---
+pitcher_z_scores = zscore_table(pitcher_data, PITCHER_CATEGORIES, PITCHER_VOLUME)
+hitter_z_scores = zscore_table(hitter_data, HITTER_CATEGORIES, HITTER_VOLUME)
 
 # --- Rank and Save ---
-pitcher_z_scores_ranked = pitcher_z_scores.sort_values(by='Total Z-Score', ascending=False)
-hitter_z_scores_ranked = hitter_z_scores.sort_values(by='Total Z-Score', ascending=False)
-pitcher_z_scores_ranked.to_csv("pitcher_z_scores.csv", index=False)
-hitter_z_scores_ranked.to_csv("hitter_z_scores.csv", index=False)
-pitcher_z_scores_ranked = pd.read_csv("pitcher_z_scores.csv")
-hitter_z_scores_ranked = pd.read_csv("hitter_z_scores.csv")
-pitcher_z_scores_ranked.insert(0, "Rank", pitcher_z_scores_ranked.index + 1)
-hitter_z_scores_ranked.insert(0, "Rank", hitter_z_scores_ranked.index + 1)
+pitcher_z_scores_ranked = ranked(pitcher_z_scores).reset_index(drop=True)
+hitter_z_scores_ranked = ranked(hitter_z_scores).reset_index(drop=True)
+pitcher_z_scores_ranked.drop(columns='Rank').to_csv("pitcher_z_scores.csv", index=False)
+hitter_z_scores_ranked.drop(columns='Rank').to_csv("hitter_z_scores.csv", index=False)
 rank_hitter_data = pd.merge(hitter_data, hitter_z_scores_ranked[['Name', 'Team', 'Rank']], on = ['Name', 'Team'], how='left')
 sortedrank_hitter_data = rank_hitter_data.sort_values(by='Rank', ascending=True)
 rank_pitcher_data = pd.merge(pitcher_data, pitcher_z_scores_ranked[['Name', 'Team', 'Rank']], on = ['Name', 'Team'], how='left')
@@ -1,97 +1,287 @@
 import os
-from fastapi import FastAPI, BackgroundTasks, Query
+import gzip
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from email.utils import format_datetime
+from fastapi import FastAPI, BackgroundTasks, Query, Request, Response
+import numpy as np
 import pandas as pd
-from pybaseball import pitching_stats, batting_stats, statcast_batter, statcast_pitcher
-from datetime import datetime, timedelta
+from pybaseball import pitching_stats, batting_stats
+from datetime import datetime, timedelta, timezone
 from apscheduler.schedulers.background import BackgroundScheduler
 from contextlib import asynccontextmanager
 import uvicorn
 
-# Global variables for caching data
-cached_pitcher_data = None
-cached_hitter_data = None
-last_updated = None
+from fetch_orchestrator import fetch_all, FetchError
+from player_index import normalize_name
+from rankings import read_positions, prepare_pitchers, prepare_hitters
+from cleaning import clean_numeric
+from zscores import PITCHER_CATEGORIES, HITTER_CATEGORIES, PITCHER_VOLUME, HITTER_VOLUME, RunningZScores, ranked, slice_rows, top_k, top_k_slices
+import statcast_store
+
+@dataclass(frozen=True)
+class RenderedPayload:
+    """A response body rendered once per snapshot, plus its validators."""
+    body: bytes
+    gzip_body: bytes
+    etag: str
+    last_modified: str
+
+@dataclass(frozen=True)
+class Leaderboard:
+    """The top LEADERBOARD_DEPTH rows of one frame, selected at publish for every (sort column, slice)."""
+    volume: np.ndarray  # raw IP or PA per row, for min_ip / min_pa
+    values: dict        # sort column -> float values per row
+    slices: dict        # ('all', None) | ('pos', Pos) | ('team', Team) -> row positions
+    masks: dict         # same keys -> boolean row mask, so a request only ANDs them
+    order: dict         # (sort column, slice) -> top row positions, best first
+
+@dataclass(frozen=True)
+class DataSnapshot:
+    """Everything request handlers read, built off to the side and published as one reference."""
+    pitchers: pd.DataFrame
+    hitters: pd.DataFrame
+    version: int
+    built_at: datetime
+    # Lookup indexes; entries are (kind, row) with kind 'pitcher' or 'hitter'
+    name_index: dict  # normalized name -> tuple of entries
+    id_index: dict    # IDfg -> tuple of entries (two-way players appear twice)
+    team_index: dict  # team -> tuple of entries
+    payloads: dict    # endpoint name -> RenderedPayload
+    leaderboards: dict  # 'pitchers' / 'hitters' -> Leaderboard
+
+# The published snapshot. Handlers read it once per request; only publish() assigns it,
+# so a reader always sees pitchers and hitters from the same refresh.
+current_snapshot = None
+# Held while a refresh runs so overlapping triggers coalesce into the running one
+refresh_lock = threading.Lock()
 
 scheduler = BackgroundScheduler()
 
-def clean_data_column(column):
-    cleaned = []
-    for item in column:
-        if isinstance(item, str):
-            cleaned_values = item.replace('$', ' ').split()
-            cleaned.append(float(cleaned_values[0]) if cleaned_values else None)
-        elif isinstance(item, (int, float)):
-            cleaned.append(float(item))
-        else:
-            cleaned.append(None)
-    return cleaned
+# Running z-score moments per pool, kept across refreshes so a refresh only folds in
+# the players whose stats moved. Only touched while refresh_lock is held.
+ranking_pools = {}
 
-def fetch_and_process_data():
-    """Fetch and process baseball data, updating global variables."""
-    global cached_pitcher_data, cached_hitter_data, last_updated
-    selected_season = "2025"
-    
-    print("Fetching and processing data...")
+# Carried through untouched instead of being z-scored
+ID_COLUMNS = ['IDfg', 'Name', 'Team', 'Pos']
 
-    # Pitcher stats
-    pitcher_data = pitching_stats(int(selected_season), int(selected_season), qual=0)
-    
-    # Clean the data columns (e.g., ERA, WHIP)
-    pitcher_data['ERA'] = clean_data_column(pitcher_data['ERA'])
-    pitcher_data['WHIP'] = clean_data_column(pitcher_data['WHIP'])
-    
-    pitcher_data_filtered = pitcher_data[pitcher_data['IP'] > 0]
+# Columns served by /pitchers and /hitters
+PITCHER_COLUMNS = ['Name', 'Team', 'Total Z-Score', 'W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD']
+HITTER_COLUMNS = ['Name', 'Team', 'Total Z-Score', 'R', 'HR', 'RBI', 'SB', 'AVG']
+# Columns a leaderboard can be sorted by
+PITCHER_SORTS = ['Total Z-Score', 'W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD']
+HITTER_SORTS = ['Total Z-Score', 'R', 'HR', 'RBI', 'SB', 'AVG']
+# Rows preselected per (sort column, slice); deeper pages are selected per request
+LEADERBOARD_DEPTH = 1000
 
-    # Ensure all columns are numeric
-    pitcher_numeric = pitcher_data_filtered.drop(columns=['Name', 'Team']).apply(pd.to_numeric, errors='coerce')
-    
-    # Calculate mean and std for the pitcher stats
-    pitcher_stats_mean = pitcher_numeric.mean()
-    pitcher_stats_std = pitcher_numeric.std()
-    
-    # Calculate Z-scores
-    pitcher_z_scores = (pitcher_numeric - pitcher_stats_mean) / pitcher_stats_std
+# Rate columns that can arrive as text, and FanGraphs' "$24.3" value columns.
+# Currency is parsed but carried through like ID_COLUMNS rather than z-scored.
+RATE_COLUMNS = ['ERA', 'WHIP', 'AVG']
+CURRENCY_COLUMNS = ['Dollars', 'Dol']
+
+def clean_numeric_columns(frame):
+    """Parse every rate/currency column present in frame to float, in place."""
+    for column in RATE_COLUMNS + CURRENCY_COLUMNS:
+        # FanGraphs usually sends the rates as floats already; only text needs parsing
+        if column in frame.columns and frame[column].dtype != 'float64':
+            frame[column] = clean_numeric(frame[column])
+    return [c for c in CURRENCY_COLUMNS if c in frame.columns]
 
-    # Invert ERA and WHIP
-    for col in ['ERA', 'WHIP']:
-        if col in pitcher_z_scores.columns:
-            pitcher_z_scores[col] *= -1
+def rank_pool(kind, data, categories, volume, passthrough):
+    """Ranked z-scores, playing time per row, and how many players changed since the last refresh."""
+    pool = ranking_pools.get(kind)
+    if pool is None or pool.id_columns != passthrough:
+        pool = ranking_pools[kind] = RunningZScores(data, categories, volume, id_columns=passthrough)
+        moved = len(data)
+    else:
+        moved = pool.sync(data)
+    table = ranked(pool.table())
+    volumes = pool.volumes[pool.keys.get_indexer(table.index)]
+    return table.reset_index(drop=True), volumes, moved
 
-    # Combine name and team back
-    pitcher_z_scores = pd.concat([pitcher_data_filtered[['Name', 'Team']].reset_index(drop=True), pitcher_z_scores.reset_index(drop=True)], axis=1)
-    pitcher_z_scores['Total Z-Score'] = pitcher_z_scores.drop(columns=['Name', 'Team']).sum(axis=1)
+def build_snapshot(version):
+    """
+    Fetch and process baseball data into a new, unpublished snapshot, or None
+    when no player's stats changed since the published one.
+    """
+    selected_season = "2025"
+
+    # Pitching, batting and the position files are independent pulls, so fetch them concurrently
+    fetched = fetch_all({
+        'pitching': lambda: pitching_stats(int(selected_season), int(selected_season), qual=0),
+        'batting': lambda: batting_stats(int(selected_season), int(selected_season), qual=0),
+        'positions': read_positions,
+    })
+    pitcher_positions, hitter_positions = fetched['positions']
+
+    # Pitcher stats, with roster corrections and Pos from the position file
+    pitcher_data = prepare_pitchers(fetched['pitching'], pitcher_positions)
     
-    cached_pitcher_data = pitcher_z_scores.sort_values(by='Total Z-Score', ascending=False)
+    # Clean the data columns (e.g., ERA, WHIP, Dollars)
+    pitcher_passthrough = ID_COLUMNS + clean_numeric_columns(pitcher_data)
+
+    # IP-weighted z-scores for the scoring categories, same engine as the Streamlit app
+    pitchers, pitcher_volume, pitchers_moved = rank_pool('pitchers', pitcher_data, PITCHER_CATEGORIES, PITCHER_VOLUME, pitcher_passthrough)
 
     # Hitter stats
-    hitter_data = batting_stats(int(selected_season), int(selected_season), qual=0)
+    hitter_data = prepare_hitters(fetched['batting'], hitter_positions)
     
-    # Clean the data column (e.g., AVG)
-    hitter_data['AVG'] = clean_data_column(hitter_data['AVG'])
-    
-    hitter_data_filtered = hitter_data[hitter_data['PA'] > 0]
-    
-    # Ensure all columns are numeric
-    hitter_numeric = hitter_data_filtered.drop(columns=['Name', 'Team']).apply(pd.to_numeric, errors='coerce')
-    
-    # Calculate mean and std for the hitter stats
-    hitter_stats_mean = hitter_numeric.mean()
-    hitter_stats_std = hitter_numeric.std()
-    
-    # Calculate Z-scores
-    hitter_z_scores = (hitter_numeric - hitter_stats_mean) / hitter_stats_std
+    # Clean the data columns (e.g., AVG, Dol)
+    hitter_passthrough = ID_COLUMNS + clean_numeric_columns(hitter_data)
 
-    # Adjust AVG based on PA
-    hitter_z_scores['AVG'] = (hitter_data_filtered['AVG'] - hitter_stats_mean['AVG']) / (hitter_stats_std['AVG'] / (hitter_data_filtered['PA'] ** 0.5))
+    # PA-weighted z-scores
+    hitters, hitter_volume, hitters_moved = rank_pool('hitters', hitter_data, HITTER_CATEGORIES, HITTER_VOLUME, hitter_passthrough)
+    print(f"📈 {pitchers_moved} pitchers and {hitters_moved} hitters changed")
+    if current_snapshot is not None and pitchers_moved == 0 and hitters_moved == 0:
+        return None
 
-    # Combine name and team back
-    hitter_z_scores = pd.concat([hitter_data_filtered[['Name', 'Team']].reset_index(drop=True), hitter_z_scores.reset_index(drop=True)], axis=1)
-    hitter_z_scores['Total Z-Score'] = hitter_z_scores.drop(columns=['Name', 'Team']).sum(axis=1)
-    
-    cached_hitter_data = hitter_z_scores.sort_values(by='Total Z-Score', ascending=False)
+    built_at = datetime.now()
+    payloads = {
+        'pitchers': render_payload(pitchers[PITCHER_COLUMNS].head(100), built_at),
+        'hitters': render_payload(hitters[HITTER_COLUMNS].head(100), built_at),
+    }
+    leaderboards = {
+        'pitchers': build_leaderboard(pitchers, pitcher_volume, PITCHER_SORTS),
+        'hitters': build_leaderboard(hitters, hitter_volume, HITTER_SORTS),
+    }
+    return DataSnapshot(pitchers=pitchers, hitters=hitters, version=version, built_at=built_at,
+                        payloads=payloads, leaderboards=leaderboards, **build_indexes(pitchers, hitters))
+
+def build_indexes(pitchers, hitters):
+    """Hash indexes from normalized name, IDfg and team to (kind, row) entries."""
+    name_index, id_index, team_index = {}, {}, {}
+    for kind, frame in (('pitcher', pitchers), ('hitter', hitters)):
+        for row, (idfg, name, team) in enumerate(zip(frame['IDfg'], frame['Name'], frame['Team'])):
+            entry = (kind, row)
+            name_index.setdefault(normalize_name(name), []).append(entry)
+            id_index.setdefault(int(idfg), []).append(entry)
+            team_index.setdefault(team, []).append(entry)
+    freeze = lambda index: {key: tuple(entries) for key, entries in index.items()}
+    return {'name_index': freeze(name_index), 'id_index': freeze(id_index), 'team_index': freeze(team_index)}
+
+def build_leaderboard(frame, volume, sort_columns):
+    """Select the top rows by every sort column within every position and team slice."""
+    slices = {(kind, value if value is None else str(value).upper()): rows
+              for (kind, value), rows in slice_rows(frame).items()}
+    return Leaderboard(
+        volume=np.nan_to_num(volume.astype(float)),
+        values={column: frame[column].to_numpy(dtype=float) for column in sort_columns},
+        slices=slices,
+        masks={key: np.isin(np.arange(len(frame)), rows) for key, rows in slices.items()},
+        order=top_k_slices(frame, sort_columns, LEADERBOARD_DEPTH, slices),
+    )
+
+def query_leaderboard(snapshot, name, frame, default_columns, sort, pos, team, min_volume, offset, limit, columns):
+    """Filter, page and project a leaderboard from its preselected top rows, without re-sorting."""
+    leaderboard = snapshot.leaderboards[name]
+    columns = [c.strip() for c in columns.split(',')] if columns else default_columns
+    unknown = [c for c in columns if c not in frame.columns]
+    if unknown:
+        return {"error": f"❌ Unknown column(s): {', '.join(unknown)}"}
+    if sort not in leaderboard.values:
+        return {"error": f"❌ Invalid sort. Use one of: {', '.join(leaderboard.values)}"}
+
+    # Start from the narrower slice's top rows; apply the other filters as a mask
+    keys = [key for key in (('pos', pos), ('team', team)) if key[1] is not None]
+    keys = [(kind, value.upper()) for kind, value in keys] or [('all', None)]
+    empty = np.array([], dtype=np.intp)
+    keys.sort(key=lambda key: len(leaderboard.slices.get(key, empty)))
+    nobody = np.zeros(len(frame), dtype=bool)
+    selected = leaderboard.masks.get(keys[0], nobody)
+    # Never AND in place: the masks are shared by every request on this snapshot
+    for key in keys[1:]:
+        selected = selected & leaderboard.masks.get(key, nobody)
+    if min_volume:
+        selected = selected & (leaderboard.volume >= min_volume)
+
+    top = leaderboard.order.get((sort, keys[0]), empty)
+    rows = top[selected[top]]
+    # The preselected rows run out before this page once the slice is deeper than
+    # LEADERBOARD_DEPTH; select just enough of the filtered rows instead
+    if len(rows) < offset + limit and len(top) < len(leaderboard.slices.get(keys[0], empty)):
+        rows = top_k(leaderboard.values[sort], offset + limit, np.flatnonzero(selected))
+
+    page = frame.iloc[rows[offset:offset + limit]][columns]
+    headers = {"X-Snapshot-Version": str(snapshot.version), "X-Total-Count": str(int(selected.sum()))}
+    return Response(page.to_json(orient="records", double_precision=15), media_type="application/json", headers=headers)
+
+def render_payload(frame, built_at):
+    """Serialize a frame to JSON bytes (pandas' C encoder) and gzip it, once."""
+    body = frame.to_json(orient="records", double_precision=15).encode()
+    return RenderedPayload(
+        body=body,
+        gzip_body=gzip.compress(body),
+        etag='"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"',
+        last_modified=format_datetime(built_at.astimezone(timezone.utc), usegmt=True),
+    )
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match against one ETag: "*" matches anything, W/ validators compare weakly."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+def serve_payload(request, name):
+    """Serve a prerendered payload, answering conditional requests with 304."""
+    snapshot = current_snapshot
+    if snapshot is None:
+        return Response(json.dumps({"error": "⚠️ Data not loaded yet"}), media_type="application/json")
+    payload = snapshot.payloads[name]
+    headers = {
+        "ETag": payload.etag,
+        "Last-Modified": payload.last_modified,
+        "X-Snapshot-Version": str(snapshot.version),
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(request.headers.get("if-none-match", ""), payload.etag):
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(payload.gzip_body, media_type="application/json", headers={**headers, "Content-Encoding": "gzip"})
+    return Response(payload.body, media_type="application/json", headers=headers)
+
+def player_record(snapshot, entry):
+    """One row as a JSON-safe dict (NaN -> null), tagged with pitcher/hitter."""
+    kind, row = entry
+    frame = snapshot.pitchers if kind == 'pitcher' else snapshot.hitters
+    record = json.loads(frame.iloc[[row]].to_json(orient="records"))[0]
+    record['type'] = kind
+    return record
 
-    last_updated = datetime.now()
-    print(f"✅ Data updated at {last_updated}")
+def publish(snapshot):
+    global current_snapshot
+    current_snapshot = snapshot
+
+def fetch_and_process_data():
+    """Build a fresh snapshot and swap it in, unless a refresh is already running."""
+    if not refresh_lock.acquire(blocking=False):
+        print("⏭️ Refresh already in progress, skipping")
+        return False
+    try:
+        print("Fetching and processing data...")
+        version = current_snapshot.version + 1 if current_snapshot is not None else 1
+        try:
+            snapshot = build_snapshot(version)
+            if snapshot is not None:
+                publish(snapshot)
+        except FetchError as e:
+            print(f"❌ Fetch failed, keeping the current data: {e}")
+            return False
+        except Exception:
+            # rank_pool may already have synced the pools to data that never got published;
+            # start them over so the next refresh re-ranks everyone instead of reporting 0 moved
+            ranking_pools.clear()
+            raise
+        if snapshot is None:
+            print(f"✅ No stat changes, keeping version {current_snapshot.version}")
+            return True
+        print(f"✅ Data updated at {snapshot.built_at} (version {snapshot.version})")
+        return True
+    finally:
+        refresh_lock.release()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -100,6 +290,8 @@ async def lifespan(app: FastAPI):
     scheduler.add_job(fetch_and_process_data, "date", run_date=datetime.now() + timedelta(seconds=2))
     # Schedule future updates every 24 hours
     scheduler.add_job(fetch_and_process_data, "interval", hours=24, next_run_time=datetime.now() + timedelta(minutes=1))
+    # Keep the local Statcast store behind /filter_stats filled, newest day first thing and then daily
+    scheduler.add_job(statcast_store.refresh, "interval", hours=24, next_run_time=datetime.now() + timedelta(seconds=5))
     scheduler.start()
     yield
     scheduler.shutdown()
@@ -109,35 +301,84 @@ app = FastAPI(lifespan=lifespan)
 @app.get("/update_data")
 def update_data(background_tasks: BackgroundTasks):
     """Trigger a manual data update in the background."""
+    if refresh_lock.locked():
+        return {"message": "⏳ A data update is already running."}
     background_tasks.add_task(fetch_and_process_data)
     return {"message": "✅ Data update started in the background."}
 
+@app.get("/status")
+def status():
+    """Version and build time of the published snapshot."""
+    snapshot = current_snapshot
+    return {
+        "version": snapshot.version if snapshot is not None else None,
+        "built_at": snapshot.built_at.isoformat() if snapshot is not None else None,
+        "refreshing": refresh_lock.locked(),
+    }
+
 @app.get("/pitchers")
-def get_pitchers():
-    if cached_pitcher_data is None:
+async def get_pitchers(
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    pos: str = Query(None),
+    team: str = Query(None),
+    min_ip: float = Query(0, ge=0),
+    sort: str = Query('Total Z-Score'),
+    columns: str = Query(None, description="Comma-separated column projection"),
+):
+    """Pitcher leaderboard. With no parameters, serves the prerendered top 100."""
+    if not request.query_params:
+        return serve_payload(request, 'pitchers')
+    snapshot = current_snapshot
+    if snapshot is None:
         return {"error": "⚠️ Data not loaded yet"}
-    pitchers = cached_pitcher_data[['Name', 'Team', 'Total Z-Score', 'W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD']].head(100).to_dict(orient="records")
-    return pitchers
+    return query_leaderboard(snapshot, 'pitchers', snapshot.pitchers, PITCHER_COLUMNS,
+                             sort, pos, team, min_ip, offset, limit, columns)
 
 @app.get("/hitters")
-def get_hitters():
-    if cached_hitter_data is None:
+async def get_hitters(
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    pos: str = Query(None),
+    team: str = Query(None),
+    min_pa: float = Query(0, ge=0),
+    sort: str = Query('Total Z-Score'),
+    columns: str = Query(None, description="Comma-separated column projection"),
+):
+    """Hitter leaderboard. With no parameters, serves the prerendered top 100."""
+    if not request.query_params:
+        return serve_payload(request, 'hitters')
+    snapshot = current_snapshot
+    if snapshot is None:
         return {"error": "⚠️ Data not loaded yet"}
-    hitters = cached_hitter_data[['Name', 'Team', 'Total Z-Score', 'R', 'HR', 'RBI', 'SB', 'AVG']].head(100).to_dict(orient="records")
-    return hitters
+    return query_leaderboard(snapshot, 'hitters', snapshot.hitters, HITTER_COLUMNS,
+                             sort, pos, team, min_pa, offset, limit, columns)
 
 @app.get("/player/{player_name}")
-def get_player(player_name: str):
-    """Fetch player stats from cached data."""
-    if cached_pitcher_data is None or cached_hitter_data is None:
+def get_player(player_name: str, response: Response, team: str = Query(None)):
+    """
+    Fetch player stats from cached data by name (case/accent-insensitive) or IDfg.
+    Pass ?team= to pick between players who share a name.
+    """
+    snapshot = current_snapshot
+    if snapshot is None:
         return {"error": "⚠️ Data not loaded yet"}
+    response.headers["X-Snapshot-Version"] = str(snapshot.version)
 
-    player_stats = cached_pitcher_data[cached_pitcher_data['Name'] == player_name]
-    if player_stats.empty:
-        player_stats = cached_hitter_data[cached_hitter_data['Name'] == player_name]
-    if not player_stats.empty:
-        return player_stats.iloc[0].to_dict()
-    return {"error": "❌ Player not found"}
+    if player_name.isdigit():
+        entries = snapshot.id_index.get(int(player_name), ())
+    else:
+        entries = snapshot.name_index.get(normalize_name(player_name), ())
+    if team is not None:
+        on_team = set(snapshot.team_index.get(team.upper(), ()))
+        entries = tuple(entry for entry in entries if entry in on_team)
+    if not entries:
+        return {"error": "❌ Player not found"}
+    if len(entries) == 1:
+        return player_record(snapshot, entries[0])
+    return {"matches": [player_record(snapshot, entry) for entry in entries]}
 
 @app.get("/filter_stats")
 def filter_stats(
@@ -164,22 +405,17 @@ def filter_stats(
     start_str = start_date.strftime("%Y-%m-%d")
     end_str = end_date.strftime("%Y-%m-%d")
 
-    try:
-        if type == "pitcher":
-            data = statcast_pitcher(start_dt=start_str, end_dt=end_str)
-            columns_to_return = ["player_name", "pitch_type", "release_speed", "release_spin_rate", "whiff"]
-        elif type == "hitter":
-            data = statcast_batter(start_dt=start_str, end_dt=end_str)
-            columns_to_return = ["player_name", "events", "launch_speed", "launch_angle", "babip"]
-        else:
-            return {"error": "❌ Invalid type. Use 'pitcher' or 'hitter'."}
-    except Exception as e:
-        return {"error": f"Error fetching data: {str(e)}"}
-
-    data = data[columns_to_return].dropna()
-    data = data.groupby("player_name").mean().reset_index()
-
-    return data.sort_values(by=columns_to_return[1], ascending=False).head(50).to_dict(orient="records")
+    if type not in statcast_store.AGGREGATES:
+        return {"error": "❌ Invalid type. Use 'pitcher' or 'hitter'."}
+
+    # Served from the local store the scheduler fills; no Savant request per call
+    data = statcast_store.window_aggregate(type, start_str, end_str)
+    if data.empty:
+        return {"error": "⚠️ No Statcast data stored for this window yet. Please try again later."}
+
+    sort_column = statcast_store.AGGREGATES[type][0][0]
+    data = data.sort_values(by=sort_column, ascending=False).head(50)
+    return json.loads(data.to_json(orient="records"))
 
 # Local dev entry point
 if __name__ == "__main__":
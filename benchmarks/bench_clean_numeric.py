@@ -0,0 +1,84 @@
+"""
+Time the per-element clean_data_column loop the backend used to run on ERA/WHIP/AVG
+against cleaning.clean_numeric as the backend now applies it, on a full-season
+FanGraphs frame.
+
+    python benchmarks/bench_clean_numeric.py
+    python benchmarks/bench_clean_numeric.py --scale 20 --repeat 50
+
+raw.csv is the saved 2025 pitching_stats frame; --scale stacks copies of it to
+see how each approach grows with row count.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from cleaning import clean_numeric
+
+# What the backend cleaned per refresh, and FanGraphs' "$24.3" text column
+CASES = {'rates': ['ERA', 'WHIP'], 'currency': ['Dollars']}
+
+
+def clean_data_column(column):
+    """The loop backend_website.py ran before clean_numeric, kept here as the baseline."""
+    cleaned = []
+    for item in column:
+        if isinstance(item, str):
+            cleaned_values = item.replace('$', ' ').split()
+            cleaned.append(float(cleaned_values[0]) if cleaned_values else None)
+        elif isinstance(item, (int, float)):
+            cleaned.append(float(item))
+        else:
+            cleaned.append(None)
+    return cleaned
+
+
+def loop(frame, columns):
+    for column in columns:
+        frame[column] = clean_data_column(frame[column])
+    return frame
+
+
+def vectorized(frame, columns):
+    # backend_website.clean_numeric_columns
+    for column in columns:
+        if frame[column].dtype != 'float64':
+            frame[column] = clean_numeric(frame[column])
+    return frame
+
+
+def timed(fn, frame, columns, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        copy = frame.copy()
+        start = time.perf_counter()
+        result = fn(copy, columns)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=1, help="stack this many copies of the season")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    season = pd.read_csv(os.path.join(REPO, 'raw.csv'), index_col=0)
+    for case, columns in CASES.items():
+        frame = season[columns]
+        if case == 'currency':
+            # The loop cannot parse negative values, written "($1.2)", so compare on the rest
+            frame = frame[~frame['Dollars'].str.startswith('(')]
+        frame = pd.concat([frame] * args.scale, ignore_index=True)
+        loop_time, expected = timed(loop, frame, columns, args.repeat)
+        vector_time, result = timed(vectorized, frame, columns, args.repeat)
+        assert np.allclose(expected.to_numpy(float), result.to_numpy(float), equal_nan=True)
+        print(f"{case:9s} rows={len(frame):6d}  loop {loop_time * 1000:7.2f} ms  "
+              f"clean_numeric {vector_time * 1000:7.2f} ms  ({loop_time / vector_time:.1f}x)")
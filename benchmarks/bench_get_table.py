@@ -0,0 +1,90 @@
+"""
+Time and peak memory of the BeautifulSoup get_table path against the streaming
+get_table_lxml parser on a saved Baseball-Reference daily.cgi page.
+
+    python benchmarks/bench_get_table.py saved_season_page.html
+    python benchmarks/bench_get_table.py --synthetic 1500
+
+Each parser runs in its own subprocess so peak RSS (ru_maxrss) is not shared.
+"""
+import argparse
+import importlib.util
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEADINGS = ['Rk', 'Name', '', 'Age', '#days', 'Lev', 'Tm', 'G', 'PA', 'AB', 'R', 'H', '2B', '3B',
+            'HR', 'RBI', 'BB', 'IBB', 'SO', 'HBP', 'SH', 'SF', 'GDP', 'SB', 'CS', 'BA', 'OBP', 'SLG', 'OPS']
+
+
+def load_module():
+    # league_batting_stats.py uses pybaseball's relative imports, so load it as a pybaseball submodule
+    import pybaseball
+    spec = importlib.util.spec_from_file_location('pybaseball._bench_league_batting_stats',
+                                                  os.path.join(REPO, 'league_batting_stats.py'))
+    module = importlib.util.module_from_spec(spec)
+    module.__package__ = pybaseball.__name__
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_page(rows):
+    """A page shaped like daily.cgi: one table, thead, rank in <th>, anchors carrying mlb_ID."""
+    rng = random.Random(0)
+    out = ['<html><head><meta charset="utf-8"></head><body><div>',
+           '<table id="daily"><thead><tr>', ''.join(f'<th>{h}</th>' for h in HEADINGS), '</tr></thead><tbody>']
+    for i in range(rows):
+        if i and i % 25 == 0:
+            out.append('<tr class="thead">' + ''.join(f'<th>{h}</th>' for h in HEADINGS) + '</tr>')
+        stats = [rng.randint(0, 600) for _ in range(18)]
+        rates = [f'.{rng.randint(100, 999)}' for _ in range(4)]
+        out.append(f'<tr><th>{i + 1}</th><td><a href="/redirect.fcgi?player=1&amp;mlb_ID={600000 + i}">Player&nbsp;{i}</a></td>'
+                   f'<td></td><td>{rng.randint(20, 40)}</td><td>{rng.randint(1, 200)}</td><td>Maj-AL</td><td>Boston</td>'
+                   + ''.join(f'<td>{v}</td>' for v in stats) + ''.join(f'<td>{v}</td>' for v in rates) + '</tr>')
+    out.append('</tbody></table></div></body></html>')
+    return ''.join(out).encode('utf-8')
+
+
+def run_one(mode, path, repeat):
+    module = load_module()
+    with open(path, 'rb') as f:
+        html = f.read()
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if mode == 'bs4':
+            # same encoding workaround as get_soup
+            soup = module.BeautifulSoup(str(html).encode(), features="lxml")
+            table = module.get_table(soup)
+        else:
+            table = module.get_table_lxml(html)
+    elapsed = (time.perf_counter() - start) / repeat
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    print(f"{mode:5s} rows={len(table):6d}  {elapsed * 1000:9.1f} ms/parse  peak +{peak / 1024:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("page", nargs="?", help="saved daily.cgi HTML page")
+    parser.add_argument("--synthetic", type=int, default=None, help="generate a page with this many rows instead")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--mode", choices=["bs4", "lxml"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_one(args.mode, args.page, args.repeat)
+        sys.exit(0)
+
+    path = args.page
+    if path is None:
+        fd, path = tempfile.mkstemp(suffix=".html")
+        with os.fdopen(fd, "wb") as f:
+            f.write(synthetic_page(args.synthetic or 1500))
+    print(f"page: {path} ({os.path.getsize(path) / 1024:.0f} KiB)")
+    for mode in ["bs4", "lxml"]:
+        subprocess.run([sys.executable, __file__, path, "--mode", mode, "--repeat", str(args.repeat)], check=True)
@@ -0,0 +1,86 @@
+"""
+Time z-score cell coloring the old way, Styler.applymap calling a Python
+threshold chain per cell, against styling.style_z_scores with the CSS computed
+once (as data_layer caches it per snapshot) and applied in one step.
+
+    python benchmarks/bench_styling.py
+    python benchmarks/bench_styling.py --scale 20 --repeat 5
+
+Input is the saved 2025 pitching frame (raw.csv), ranked with zscore_table;
+the top-100 view is its first 100 rows. --scale stacks copies to see how each approach
+grows with row count. Only the Styler computation is timed, not Streamlit's
+serialization of the styled frame.
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+import pandas as pd
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from raw_loader import CACHE_DIR, load_raw
+from styling import style_z_scores, z_score_css
+from zscores import PITCHER_CATEGORIES, PITCHER_VOLUME, zscore_table, ranked
+
+COLUMNS = ['W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD']
+
+
+def color_z_scores(val):
+    """streamlit_app.py's per-cell styler before styling.py, kept here as the baseline."""
+    try:
+        # Handle None or NaN explicitly
+        if val is None or (isinstance(val, float) and math.isnan(val)):
+            return ""  # no style for None/NaN
+
+        val = float(val)
+        if val >= 2.5:
+            color = "#006400"  # dark green
+        elif val >= 1.5:
+            color = "#008000"  # green
+        elif val >= 0.5:
+            color = "#32CD32"  # light green
+        elif val >= -0.5:
+            color = "#FFFFFF"  # white
+        elif val >= -1.5:
+            color = "#FFA07A"  # light red
+        elif val >= -2.5:
+            color = "#FF0000"  # red
+        else:
+            color = "#8B0000"  # dark red
+        return f"background-color: {color}; color: black;"
+    except:
+        return ""
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=1, help="stack this many copies of the table")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    data = load_raw('raw.csv', root=REPO, cache_dir=os.path.join(REPO, CACHE_DIR)).assign(Pos='UTIL')
+    data = pd.concat([data] * args.scale, ignore_index=True)
+    table = ranked(zscore_table(data, PITCHER_CATEGORIES, PITCHER_VOLUME)).reset_index(drop=True)
+    css = z_score_css(table, COLUMNS)
+    for view, frame in (('top 100', table.head(100)), ('all', table)):
+        # Styler.map is applymap's current name
+        map_time, expected = best_of(lambda: frame.style.map(color_z_scores, subset=COLUMNS)._compute(), args.repeat)
+        apply_time, result = best_of(lambda: style_z_scores(frame, COLUMNS, css)._compute(), args.repeat)
+        assert expected.ctx == result.ctx
+        print(f"{view:8s} rows={len(frame):6d}  per-cell {map_time * 1000:7.2f} ms  "
+              f"cached css {apply_time * 1000:7.2f} ms  ({map_time / apply_time:.1f}x)")
+    css_time, _ = best_of(lambda: z_score_css(table, COLUMNS), args.repeat)
+    print(f"z_score_css for all {len(table)} rows, once per snapshot: {css_time * 1000:.2f} ms")
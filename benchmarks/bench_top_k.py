@@ -0,0 +1,70 @@
+"""
+Time the backend's leaderboard build the old way, a full stable argsort of every
+(sort column, position/team slice), against zscores.top_k_slices, which
+partitions out only the top K rows of each slice.
+
+    python benchmarks/bench_top_k.py
+    python benchmarks/bench_top_k.py --scale 20 --k 100
+
+Inputs are the saved FanGraphs frames with positions (diw.csv, .csv), ranked
+with zscore_table; --scale stacks copies of them to see how each approach grows
+with row count.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from raw_loader import CACHE_DIR, load_raw
+from zscores import PITCHER_CATEGORIES, HITTER_CATEGORIES, PITCHER_VOLUME, HITTER_VOLUME, zscore_table, ranked, slice_rows, top_k_slices
+
+CASES = {
+    'pitchers': ('diw.csv', {}, PITCHER_CATEGORIES, PITCHER_VOLUME),
+    'hitters': ('.csv', {'Pos_y': 'Pos'}, HITTER_CATEGORIES, HITTER_VOLUME),
+}
+
+
+def full_sorts(frame, columns, slices):
+    """build_leaderboard before top-K selection, kept here as the baseline."""
+    order = {}
+    for column in columns:
+        values = frame[column].to_numpy(dtype=float)
+        values = np.where(np.isnan(values), -np.inf, values)
+        for key, rows in slices.items():
+            order[(column, key)] = rows[np.argsort(-values[rows], kind='stable')]
+    return order
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=1, help="stack this many copies of each frame")
+    parser.add_argument("--k", type=int, default=100, help="rows kept per slice")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for case, (path, renames, categories, volume) in CASES.items():
+        data = load_raw(path, root=REPO, cache_dir=os.path.join(REPO, CACHE_DIR)).rename(columns=renames)
+        data = pd.concat([data] * args.scale, ignore_index=True)
+        frame = ranked(zscore_table(data, categories, volume)).reset_index(drop=True)
+        columns = ['Total Z-Score'] + [spec.column for spec in categories]
+        slices = slice_rows(frame)
+        sort_time, expected = best_of(lambda: full_sorts(frame, columns, slices), args.repeat)
+        top_time, result = best_of(lambda: top_k_slices(frame, columns, args.k, slices), args.repeat)
+        assert all((expected[key][:args.k] == rows).all() for key, rows in result.items())
+        print(f"{case:9s} rows={len(frame):6d} pairs={len(result):4d}  full sort {sort_time * 1000:7.2f} ms  "
+              f"top-{args.k} {top_time * 1000:7.2f} ms  ({sort_time / top_time:.1f}x)")
@@ -0,0 +1,97 @@
+"""
+Time the per-column Series arithmetic rankings.py used for pitcher and hitter
+z-scores against the shared zscores.zscore_table float32 matrix engine.
+
+    python benchmarks/bench_zscores.py
+    python benchmarks/bench_zscores.py --scale 20 --repeat 50
+
+Inputs are the saved 2025 FanGraphs frames (raw.csv, .csv), read through
+raw_loader with just the ranking columns; --scale stacks copies of them to see
+how each approach grows with row count.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from raw_loader import CACHE_DIR, load_ranking_inputs
+from zscores import PITCHER_CATEGORIES, HITTER_CATEGORIES, PITCHER_VOLUME, HITTER_VOLUME, zscore_table
+
+
+def series_pitcher_zscores(pitcher_data):
+    """rankings.pitcher_zscores before the shared engine, kept here as the baseline."""
+    pitcher_categories = ['Name','Team', 'Pos', 'W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD','IP']
+    pitcher_data_categories = pitcher_data[pitcher_categories]
+    pitcher_data_filtered = pitcher_data_categories[pitcher_data_categories['IP'] > 0].copy()
+    pitcher_stats_mean = pitcher_data_filtered.drop(columns=['Name','Team', 'Pos',]).mean()
+    pitcher_stats_std = pitcher_data_filtered.drop(columns=['Name','Team', 'Pos',]).std()
+    pitcher_numeric_columns = ['W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD']
+    pitcher_z_scores = (pitcher_data_filtered[pitcher_numeric_columns] - pitcher_stats_mean[pitcher_numeric_columns]) / pitcher_stats_std[pitcher_numeric_columns]
+    pitcher_data_filtered['Weighted_ERA'] = (pitcher_data_filtered['ERA'] - pitcher_stats_mean['ERA']) / (pitcher_stats_std['ERA'] / (pitcher_data_filtered['IP'] ** 0.5))
+    pitcher_z_scores['ERA'] = (pitcher_data_filtered['Weighted_ERA'] - pitcher_data_filtered['Weighted_ERA'] .mean()) / pitcher_data_filtered['Weighted_ERA'] .std()
+    pitcher_data_filtered['Weighted_WHIP'] = (pitcher_data_filtered['WHIP'] - pitcher_stats_mean['WHIP']) / (pitcher_stats_std['WHIP'] / (pitcher_data_filtered['IP'] ** 0.5))
+    pitcher_z_scores['WHIP'] = (pitcher_data_filtered['Weighted_WHIP'] - pitcher_data_filtered['Weighted_WHIP'] .mean()) / pitcher_data_filtered['Weighted_WHIP'] .std()
+    pitcher_z_scores['ERA'] *= -1
+    pitcher_z_scores['WHIP'] *= -1
+    pitcher_z_scores.insert(0, 'Name', pitcher_data_filtered['Name'])
+    pitcher_z_scores.insert(1, 'Team', pitcher_data_filtered['Team'])
+    pitcher_z_scores.insert(2, 'Pos', pitcher_data_filtered['Pos'])
+    pitcher_z_scores['Total Z-Score'] = pitcher_z_scores[pitcher_numeric_columns].sum(axis=1)
+    return pitcher_z_scores
+
+
+def series_hitter_zscores(hitter_data):
+    """rankings.hitter_zscores before the shared engine, kept here as the baseline."""
+    hitter_categories = ['Name','Team', 'Pos', 'R', 'HR', 'RBI', 'SB', 'AVG', 'PA']
+    hitter_data_categories = hitter_data[hitter_categories]
+    hitter_data_filtered = hitter_data_categories[hitter_data_categories['PA'] > 0].copy()
+    hitter_stats_mean = hitter_data_filtered.drop(columns=['Name','Team', 'Pos']).mean()
+    hitter_stats_std = hitter_data_filtered.drop(columns=['Name','Team', 'Pos']).std()
+    hitter_numeric_columns = ['R', 'HR', 'RBI', 'SB', 'AVG']
+    hitter_z_scores = (hitter_data_filtered[hitter_numeric_columns] - hitter_stats_mean[hitter_numeric_columns]) / hitter_stats_std[hitter_numeric_columns]
+    hitter_data_filtered['Weighted_AVG'] = (hitter_data_filtered['AVG'] - hitter_stats_mean['AVG']) / (hitter_stats_std['AVG'] / (hitter_data_filtered['PA'] ** 0.5))
+    hitter_z_scores['AVG'] = (hitter_data_filtered['Weighted_AVG'] - hitter_data_filtered['Weighted_AVG'] .mean()) / hitter_data_filtered['Weighted_AVG'] .std()
+    hitter_z_scores.insert(0, 'Name', hitter_data_filtered['Name'])
+    hitter_z_scores.insert(1, 'Team', hitter_data_filtered['Team'])
+    hitter_z_scores.insert(2, 'Pos', hitter_data_filtered['Pos'])
+    hitter_z_scores['Total Z-Score'] = hitter_z_scores[hitter_numeric_columns].sum(axis=1)
+    return hitter_z_scores
+
+
+CASES = {
+    'pitchers': (series_pitcher_zscores, PITCHER_CATEGORIES, PITCHER_VOLUME),
+    'hitters': (series_hitter_zscores, HITTER_CATEGORIES, HITTER_VOLUME),
+}
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=1, help="stack this many copies of each frame")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    inputs = dict(zip(CASES, load_ranking_inputs(root=REPO, cache_dir=os.path.join(REPO, CACHE_DIR))))
+    for case, (series, categories, volume) in CASES.items():
+        data = inputs[case].assign(Pos='UTIL')
+        data = pd.concat([data] * args.scale, ignore_index=True)
+        series_time, expected = best_of(lambda: series(data), args.repeat)
+        matrix_time, result = best_of(lambda: zscore_table(data, categories, volume), args.repeat)
+        columns = [spec.column for spec in categories] + ['Total Z-Score']
+        assert np.allclose(expected[columns].to_numpy(float), result[columns].to_numpy(float), atol=1e-4, equal_nan=True)
+        print(f"{case:9s} rows={len(data):6d}  series {series_time * 1000:7.2f} ms  "
+              f"matrix {matrix_time * 1000:7.2f} ms  ({series_time / matrix_time:.1f}x)")
@@ -0,0 +1,26 @@
+"""
+Text-to-float parsing shared by the backend refresh and raw_loader. FanGraphs
+frames carry a few numeric columns as text: "$24.3" / "($1.2)" dollar values,
+"12.5%" rates, and ERA/WHIP/AVG that occasionally arrive as strings.
+"""
+import pandas as pd
+
+# Everything clean_numeric strips before the number itself is parsed
+NOISE = r'[$,()%\s]'
+
+
+def clean_numeric(values):
+    """
+    Text-to-float for a Series: strips "$", thousands separators and whitespace,
+    reads "(1.2)" as negative and "12.5%" as 0.125. Blanks and anything else
+    unparseable become NaN; numeric input passes straight through.
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype('float64')
+    text = values.astype(str)
+    # FanGraphs only uses parentheses for negatives and % for rates, wherever they sit
+    negative = text.str.contains('(', regex=False)
+    percent = text.str.contains('%', regex=False)
+    numbers = pd.to_numeric(text.str.replace(NOISE, '', regex=True), errors='coerce').astype('float64')
+    numbers = numbers.where(~negative, -numbers)
+    return numbers.where(~percent, numbers / 100)
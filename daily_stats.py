@@ -0,0 +1,156 @@
+"""
+Season-to-date Baseball-Reference stat store for the rolling timeframes.
+stat_store/<kind>/to_date/<YYYY-MM-DD>.parquet holds every player's counting
+stats from January 1 through that date, fetched with one range request. A
+window [start, end] is the end date's totals minus the totals through the day
+before start, with the rate stats re-derived from the differences, so a window
+costs at most two requests per kind and a settled date is only fetched once.
+
+(A range page only has per-player totals for the whole range, so a multi-day
+response can't be split back into days; differences of cumulative totals are
+what keep a cold window at two requests.) pybaseball's Baseball-Reference
+session is throttled to ten requests a minute and is not thread-safe, so every
+request here is made under one lock.
+"""
+import os
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from pybaseball import pitching_stats_range, batting_stats_range
+
+STORE_DIR = "stat_store"
+ID_COLUMNS = ['Name', 'mlbID', 'Age', 'Tm', 'Lev']
+# Days after a game date before late scoring changes are taken to have landed
+SETTLE_DAYS = 2
+# An unsettled partition younger than this (seconds) is reused instead of refetched
+PROVISIONAL_TTL = 60 * 60
+
+BATTING_COUNTS = ['G', 'PA', 'AB', 'R', 'H', '2B', '3B', 'HR', 'RBI', 'BB', 'IBB', 'SO',
+                  'HBP', 'SH', 'SF', 'GDP', 'SB', 'CS']
+# IP is stored as outs so it can be summed; see ip_to_outs
+PITCHING_COUNTS = ['G', 'GS', 'W', 'L', 'SV', 'outs', 'H', 'R', 'ER', 'BB', 'SO', 'HR', 'HBP',
+                   'AB', '2B', '3B', 'IBB', 'GDP', 'SF', 'SB', 'CS', 'PO', 'BF', 'Pit']
+
+FETCHERS = {
+    'batting': (batting_stats_range, BATTING_COUNTS),
+    'pitching': (pitching_stats_range, PITCHING_COUNTS),
+}
+BREF_LOCK = threading.Lock()
+
+
+def ip_to_outs(ip):
+    """Baseball-notation innings (6.1 = 6 1/3) to outs."""
+    whole = np.floor(ip)
+    return whole * 3 + np.round((ip - whole) * 10)
+
+
+def outs_to_ip(outs):
+    return outs // 3 + (outs % 3) / 10
+
+
+def partition_path(kind, day, root=STORE_DIR):
+    return os.path.join(root, kind, 'to_date', f"{day}.parquet")
+
+
+def is_final(path, day, settle_days=SETTLE_DAYS):
+    """A partition is final once it was written at least settle_days after its date."""
+    if not os.path.exists(path):
+        return False
+    written = datetime.fromtimestamp(os.path.getmtime(path)).date()
+    return written >= date.fromisoformat(day) + timedelta(days=settle_days)
+
+
+def is_fresh(path, max_age=PROVISIONAL_TTL):
+    """Written within the last max_age seconds."""
+    return os.path.exists(path) and time.time() - os.path.getmtime(path) < max_age
+
+
+def write_partition(frame, path):
+    """Write to a temp file next to the target and rename it into place."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".parquet")
+    os.close(fd)
+    try:
+        frame.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def fetch_to_date(kind, day):
+    """Every player's counting stats from January 1 through `day`; empty before opening day."""
+    fetch, counts = FETCHERS[kind]
+    try:
+        with BREF_LOCK:
+            table = fetch(f"{day[:4]}-01-01", day)
+    except IndexError:
+        # No games in the range: the page has no stats table
+        return pd.DataFrame(columns=ID_COLUMNS + counts)
+    if kind == 'pitching':
+        table['outs'] = ip_to_outs(table['IP'])
+    table['mlbID'] = pd.to_numeric(table['mlbID'], errors='coerce')
+    return table[ID_COLUMNS + counts]
+
+
+def load_to_date(kind, day, root=STORE_DIR):
+    """Season-to-date totals through `day`, fetched first if missing or still provisional."""
+    path = partition_path(kind, day, root)
+    if not is_final(path, day) and not is_fresh(path):
+        write_partition(fetch_to_date(kind, day), path)
+    return pd.read_parquet(path)
+
+
+def player_key(stats):
+    return stats['mlbID'].fillna(stats['Name'])
+
+
+def add_rate_stats(kind, totals):
+    """Re-derive rate stats from summed components, matching the Baseball-Reference columns."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if kind == 'batting':
+            totals['BA'] = totals['H'] / totals['AB']
+            totals['OBP'] = (totals['H'] + totals['BB'] + totals['HBP']) / (totals['AB'] + totals['BB'] + totals['HBP'] + totals['SF'])
+            total_bases = totals['H'] + totals['2B'] + 2 * totals['3B'] + 3 * totals['HR']
+            totals['SLG'] = total_bases / totals['AB']
+            totals['OPS'] = totals['OBP'] + totals['SLG']
+        else:
+            innings = totals['outs'] / 3
+            totals['IP'] = outs_to_ip(totals['outs'])
+            totals['ERA'] = 9 * totals['ER'] / innings
+            totals['WHIP'] = (totals['BB'] + totals['H']) / innings
+            totals['SO9'] = 9 * totals['SO'] / innings
+            totals['SO/W'] = totals['SO'] / totals['BB']
+            totals['BAbip'] = (totals['H'] - totals['HR']) / (totals['AB'] - totals['SO'] - totals['HR'] + totals['SF'])
+            totals = totals.drop(columns='outs')
+    return totals.replace([np.inf, -np.inf], np.nan)
+
+
+def stats_window(kind, start_dt, end_dt, root=STORE_DIR):
+    """
+    Stats for [start_dt, end_dt]: totals through end_dt minus totals through
+    the day before start_dt. A window reaching back past January 1 (the
+    offseason) counts from January 1.
+    """
+    counts = FETCHERS[kind][1]
+    through_end = load_to_date(kind, end_dt, root)
+    if through_end.empty:
+        return add_rate_stats(kind, pd.DataFrame(columns=ID_COLUMNS + counts))
+    key = player_key(through_end)
+    ids = through_end.groupby(key, sort=False)[ID_COLUMNS].last()
+    totals = through_end.groupby(key, sort=False)[counts].sum()
+
+    before = (date.fromisoformat(start_dt) - timedelta(days=1)).isoformat()
+    if before[:4] == end_dt[:4]:
+        through_before = load_to_date(kind, before, root)
+        if not through_before.empty:
+            earlier = through_before.groupby(player_key(through_before), sort=False)[counts].sum()
+            totals = totals - earlier.reindex(totals.index, fill_value=0)
+
+    # Players who didn't appear in the window have no games left after the difference
+    totals = ids.join(totals)[totals['G'] > 0].reset_index(drop=True)
+    return add_rate_stats(kind, totals)
@@ -0,0 +1,87 @@
+import streamlit as st
+
+from matchup_simulator import season_weeks, simulate_matchup
+from rankings import TIMEFRAME_DAYS, fetch_stats as _fetch_stats, read_positions, rank_all
+from ranking_snapshots import load_snapshot
+from styling import z_score_css
+from zscores import PITCHER_CATEGORIES, HITTER_CATEGORIES, slice_rows, top_k_slices
+
+# Entries are keyed by (season or timeframe, as-of date), so a new day always
+# misses; the TTL only bounds how stale an intraday entry can get.
+STATS_TTL = 6 * 60 * 60
+POSITIONS_TTL = 24 * 60 * 60
+MAX_ENTRIES = 12
+# Rows shown per leaderboard slice
+TOP_PLAYERS = 100
+
+
+@st.cache_data(ttl=STATS_TTL, max_entries=MAX_ENTRIES, show_spinner="Fetching stats...")
+def fetch_stats(selected_season, as_of):
+    """Raw pitching and batting stats for a season or rolling timeframe."""
+    return _fetch_stats(selected_season, as_of)
+
+
+@st.cache_data(ttl=POSITIONS_TTL, max_entries=1)
+def load_positions():
+    return read_positions()
+
+
+@st.cache_data(ttl=STATS_TTL, max_entries=MAX_ENTRIES, show_spinner="Ranking players...")
+def load_rankings(selected_season, as_of):
+    """
+    Ranked z-score tables and rank-sorted raw stats for a season or timeframe.
+    Served from a prebuilt snapshot when one exists for this as-of date; cached
+    separately from fetch_stats so UI-only reruns skip the z-score math too.
+    """
+    snapshot = load_snapshot(selected_season, as_of)
+    if snapshot is not None:
+        return snapshot
+
+    pitcher_dat, hitter_dat = fetch_stats(selected_season, as_of)
+    pitcher_positions, hitter_positions = load_positions()
+    frames = rank_all(pitcher_dat, hitter_dat, pitcher_positions, hitter_positions, selected_season, as_of)
+
+    pitcher_z_scores_ranked, hitter_z_scores_ranked = frames[:2]
+    pitcher_z_scores_ranked.drop(columns='Rank').to_csv("pitcher_z_scores.csv", index=False)
+    hitter_z_scores_ranked.drop(columns='Rank').to_csv("hitter_z_scores.csv", index=False)
+    return frames
+
+
+@st.cache_data(ttl=STATS_TTL, max_entries=MAX_ENTRIES)
+def load_top_players(selected_season, as_of, k=TOP_PLAYERS):
+    """
+    Row positions of the top k players for every position slice, for each of
+    the four load_rankings frames: by Total Z-Score for the z-score tables and
+    by Rank for the raw stats. Keyed ('all', None) or ('pos', Pos).
+    """
+    frames = load_rankings(selected_season, as_of)
+    top = []
+    for frame, column, ascending in zip(frames, ['Total Z-Score', 'Total Z-Score', 'Rank', 'Rank'], [False, False, True, True]):
+        order = top_k_slices(frame, [column], k, slice_rows(frame, ['Pos']), ascending)
+        top.append({key: rows for (_, key), rows in order.items()})
+    return tuple(top)
+
+
+@st.cache_data(ttl=STATS_TTL, max_entries=MAX_ENTRIES)
+def load_z_score_css(selected_season, as_of):
+    """
+    Cell colors for the category columns of the pitcher and hitter z-score
+    tables, computed once per snapshot; every view styles a subset of these rows.
+    """
+    pitcher_z_scores_ranked, hitter_z_scores_ranked = load_rankings(selected_season, as_of)[:2]
+    return (z_score_css(pitcher_z_scores_ranked, [spec.column for spec in PITCHER_CATEGORIES]),
+            z_score_css(hitter_z_scores_ranked, [spec.column for spec in HITTER_CATEGORIES]))
+
+
+@st.cache_data(ttl=STATS_TTL, max_entries=MAX_ENTRIES, show_spinner="Simulating matchups...")
+def simulate(selected_season, as_of, team_a, team_b, trials):
+    """
+    Category win probabilities for two rosters, each a (hitter names, pitcher
+    names) pair, simulated from the raw stats behind the rankings.
+    """
+    sortedrank_pitcher_data, sortedrank_hitter_data = load_rankings(selected_season, as_of)[2:]
+    # Rolling timeframes cover days; a season in progress only the weeks played so far
+    weeks = TIMEFRAME_DAYS[selected_season] / 7 if selected_season in TIMEFRAME_DAYS else season_weeks(selected_season, as_of)
+    roster = lambda names: (sortedrank_hitter_data[sortedrank_hitter_data['Name'].isin(names[0])],
+                            sortedrank_pitcher_data[sortedrank_pitcher_data['Name'].isin(names[1])])
+    return simulate_matchup(roster(team_a), roster(team_b), trials, weeks)
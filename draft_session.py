@@ -0,0 +1,196 @@
+"""
+Live draft assistant over the ranked z-score tables. A DraftSession records
+picks as they happen and keeps, per roster position, the replacement level (the
+Total Z-Score of the best player left once every open starting slot at that
+position is filled) and every remaining player's value over replacement (VOR).
+UTIL takes any hitter, so its level is taken from the hitters left over once
+the positional hitter slots have been filled.
+
+A pick only touches the positions the drafted player can fill and the slot
+they take, so replacement levels and VOR are recomputed for the players at
+those positions rather than for the whole table; each team's category totals
+move by one row. Recommendations are a top-k selection over the VOR array.
+"""
+import numpy as np
+import pandas as pd
+
+from roster_optimizer import SLOT_TEMPLATE, BENCH_SLOT, UTIL_SLOT, HITTER_SLOTS, PITCHER_SLOTS, eligible_slots
+from zscores import PITCHER_CATEGORIES, HITTER_CATEGORIES, top_k
+
+CATEGORY_COLUMNS = [spec.column for spec in PITCHER_CATEGORIES + HITTER_CATEGORIES]
+DEFAULT_TEAMS = 12
+
+
+class DraftSession:
+    """
+    Picks, replacement levels, VOR and category needs for one snake draft.
+    Players are the rows of the hitter and pitcher tables, numbered in that
+    order; a two-way player's rows (same Name and Team) are drafted together.
+    """
+
+    def __init__(self, hitters, pitchers, teams=DEFAULT_TEAMS, template=SLOT_TEMPLATE):
+        self.teams = teams
+        self.players = pd.concat([hitters.assign(Side='hitter'), pitchers.assign(Side='pitcher')], ignore_index=True)
+        self.value = np.nan_to_num(self.players['Total Z-Score'].to_numpy(dtype=float, na_value=np.nan))
+        columns = [c for c in CATEGORY_COLUMNS if c in self.players.columns]
+        self.category_columns = columns
+        self.category_z = np.nan_to_num(self.players[columns].to_numpy(dtype=float, na_value=np.nan))
+
+        # Starting positions get replacement levels; the bench does not
+        self.slot_counts = dict(template)
+        self.positions = [slot for slot, _ in template if slot != BENCH_SLOT]
+        eligible = [self._eligible(pos, side) for pos, side in zip(self.players['Pos'], self.players['Side'])]
+        self.eligible = np.array([[slot in slots for slot in self.positions] for slots in eligible], dtype=bool).reshape(len(eligible), len(self.positions))
+        # Members of each position, best first; availability is masked in place
+        order = np.argsort(-self.value, kind='stable')
+        self.members = [order[self.eligible[order, p]] for p in range(len(self.positions))]
+        self.util = self.positions.index(UTIL_SLOT) if UTIL_SLOT in self.positions else None
+        self.hitter_positions = [p for p, slot in enumerate(self.positions) if slot in HITTER_SLOTS and slot != UTIL_SLOT]
+        # Positions VOR is measured at: UTIL only for hitters with no positional slot (DH)
+        self.measured = self.eligible.copy()
+        if self.util is not None:
+            positional = np.delete(self.eligible, self.util, axis=1).any(axis=1)
+            self.measured[positional, self.util] = False
+        # Players whose VOR moves with each position's level: for UTIL, only the ones measured there
+        self.measured_members = [members[self.measured[members, p]] for p, members in enumerate(self.members)]
+        people = self.players['Name'].astype(str) + '|' + self.players['Team'].astype(str)
+        self.person = pd.factorize(people)[0]
+        self.person_rows = pd.Series(np.arange(len(self.players))).groupby(self.person).indices
+
+        self.available = np.ones(len(self.players), dtype=bool)
+        self.open_slots = np.array([teams * self.slot_counts[slot] for slot in self.positions])
+        self.team_slots = [dict(template) for _ in range(teams)]
+        self.team_totals = np.zeros((teams, len(columns)))
+        self.picks = []  # (team, row, slot) in draft order
+
+        self.replacement = np.zeros(len(self.positions))
+        self.vor = np.zeros(len(self.players))
+        self._refresh(range(len(self.positions)))
+
+    @staticmethod
+    def _eligible(pos, side):
+        """
+        Starting slots a player can fill. Hitters always fit UTIL; a pitcher with
+        no pitching position listed (or none at all) falls back to SP and RP.
+        """
+        slots = eligible_slots(pos, side) - {BENCH_SLOT}
+        return slots or set(PITCHER_SLOTS)
+
+    def _replacement_level(self, p):
+        """Total Z-Score of the first available player past this position's open slots."""
+        left = self.members[p][self.available[self.members[p]]]
+        if p == self.util:
+            # The positional slots are filled first, best available first, in template order
+            claimed = np.zeros(len(self.players), dtype=bool)
+            for h in self.hitter_positions:
+                open_rows = self.members[h][self.available[self.members[h]] & ~claimed[self.members[h]]]
+                claimed[open_rows[:self.open_slots[h]]] = True
+            left = left[~claimed[left]]
+        if len(left) == 0:
+            return 0.0
+        return self.value[left[min(self.open_slots[p], len(left) - 1)]]
+
+    def _refresh(self, affected):
+        """Re-derive replacement levels for the affected positions, then VOR for their players."""
+        affected = set(affected)
+        if not affected:
+            return
+        # UTIL's level depends on who the positional hitter slots take
+        if self.util is not None and affected & set(self.hitter_positions):
+            affected.add(self.util)
+        affected = sorted(affected)
+        for p in affected:
+            self.replacement[p] = self._replacement_level(p)
+        rows = np.unique(np.concatenate([self.measured_members[p] for p in affected]))
+        # A player is measured against the easiest of their positions to fill
+        floor = np.where(self.measured[rows], self.replacement, np.inf).min(axis=1)
+        self.vor[rows] = self.value[rows] - np.where(np.isinf(floor), 0.0, floor)
+
+    def on_the_clock(self):
+        """Team index (0-based) making the next pick in snake order."""
+        round_, slot = divmod(len(self.picks), self.teams)
+        return slot if round_ % 2 == 0 else self.teams - 1 - slot
+
+    def _slot_for(self, team, row):
+        """The team's first open slot this player fits, in template order (bench last)."""
+        fits = self._eligible(self.players['Pos'].iat[row], self.players['Side'].iat[row]) | {BENCH_SLOT}
+        for slot, left in self.team_slots[team].items():
+            if left > 0 and slot in fits:
+                return slot
+        return None
+
+    def pick(self, row, team=None):
+        """Record `row` as drafted by `team` (default: the team on the clock). Returns the slot used."""
+        team = self.on_the_clock() if team is None else team
+        if not self.available[row]:
+            raise ValueError(f"{self.players['Name'].iat[row]} has already been drafted")
+        slot = self._slot_for(team, row)
+        if slot is None:
+            raise ValueError(f"Team {team + 1} has no open roster slot for {self.players['Name'].iat[row]}")
+
+        taken = self.person_rows[self.person[row]]
+        self.available[taken] = False
+        self.team_slots[team][slot] -= 1
+        self.team_totals[team] += self.category_z[row]
+        affected = set(np.flatnonzero(self.eligible[taken].any(axis=0)))
+        if slot != BENCH_SLOT:
+            p = self.positions.index(slot)
+            self.open_slots[p] -= 1
+            affected.add(p)
+        self._refresh(affected)
+        self.picks.append((team, row, slot))
+        return slot
+
+    def undo(self):
+        """Take back the last pick."""
+        if not self.picks:
+            return
+        team, row, slot = self.picks.pop()
+        taken = self.person_rows[self.person[row]]
+        self.available[taken] = True
+        self.team_slots[team][slot] += 1
+        self.team_totals[team] -= self.category_z[row]
+        affected = set(np.flatnonzero(self.eligible[taken].any(axis=0)))
+        if slot != BENCH_SLOT:
+            p = self.positions.index(slot)
+            self.open_slots[p] += 1
+            affected.add(p)
+        self._refresh(affected)
+
+    def category_needs(self, team):
+        """How far the team trails the league's average team total in each category (0 where ahead)."""
+        return np.maximum(self.team_totals.mean(axis=0) - self.team_totals[team], 0.0)
+
+    def recommend(self, team=None, k=10, need_weight=0.0):
+        """
+        The k best available players by VOR who fit one of the team's open slots,
+        with how much each helps the team's category needs (Need Fit). A
+        need_weight above 0 adds that much of Need Fit into the ordering.
+        """
+        team = self.on_the_clock() if team is None else team
+        open_positions = [p for p, slot in enumerate(self.positions) if self.team_slots[team][slot] > 0]
+        fits = self.available.copy()
+        if self.team_slots[team].get(BENCH_SLOT, 0) == 0:
+            fits &= self.eligible[:, open_positions].any(axis=1)
+        need_fit = self.category_z @ self.category_needs(team)
+        score = np.where(fits, self.vor + need_weight * need_fit, np.nan)
+        rows = top_k(score, k, np.flatnonzero(fits))
+        board = self.players.iloc[rows][['Name', 'Team', 'Pos', 'Side', 'Total Z-Score']].copy()
+        board['VOR'] = self.vor[rows]
+        board['Need Fit'] = need_fit[rows]
+        board.insert(0, 'Player', rows)
+        return board.reset_index(drop=True)
+
+    def replacement_levels(self):
+        """Replacement level and open league-wide slots per position."""
+        return pd.DataFrame({'Position': self.positions, 'Replacement Level': self.replacement,
+                             'Open Slots': self.open_slots})
+
+    def draft_board(self):
+        """Every pick so far, in order."""
+        rows = [row for _, row, _ in self.picks]
+        board = self.players.iloc[rows][['Name', 'Team', 'Pos', 'Total Z-Score']].reset_index(drop=True)
+        board.insert(0, 'Slot', [slot for _, _, slot in self.picks])
+        board.insert(0, 'Fantasy Team', [team + 1 for team, _, _ in self.picks])
+        board.insert(0, 'Pick', np.arange(1, len(rows) + 1))
+        return board
@@ -0,0 +1,90 @@
+"""
+Run independent data pulls (FanGraphs pitching/batting, position files,
+Statcast, ...) concurrently on a bounded thread pool, so a refresh takes as long
+as the slowest source instead of the sum of all of them.
+"""
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+MAX_WORKERS = 4
+TIMEOUT = 120
+RETRIES = 2
+BACKOFF = 2.0
+# How often (seconds) running sources are checked against their timeouts
+POLL = 0.5
+
+
+class FetchError(Exception):
+    """One or more sources failed; `errors` maps source name to the exception."""
+
+    def __init__(self, errors, results):
+        self.errors = errors
+        self.results = results
+        super().__init__("; ".join(f"{name}: {error!r}" for name, error in errors.items()))
+
+
+def with_retries(name, fn, retries=RETRIES, backoff=BACKOFF):
+    """Call fn, retrying with exponential backoff on any exception."""
+    for attempt in range(retries + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == retries:
+                raise
+            print(f"⚠️ {name} failed (attempt {attempt + 1}/{retries + 1}): {e}")
+            time.sleep(backoff * 2 ** attempt)
+
+
+def fetch_all(sources, max_workers=MAX_WORKERS, timeout=TIMEOUT, retries=RETRIES, raise_errors=True):
+    """
+    Run every source concurrently and return {name: result}.
+
+    `sources` maps a name to a zero-argument callable, or to (callable, timeout)
+    to override the default per-source timeout in seconds; None means no limit.
+    The timeout applies to each attempt and its clock starts when a worker
+    begins that attempt, so time queued behind other sources or spent backing
+    off between retries doesn't count. A source that times out is abandoned
+    rather than cancelled (its thread finishes in the background), so sources
+    that write to disk should not have one. Every other source is waited for.
+    Failures raise FetchError unless raise_errors=False, in which case failed
+    sources are left out of the result.
+    """
+    results, errors = {}, {}
+    started = {}  # name -> when its current attempt began; absent while queued or backing off
+
+    def timed(name, fn):
+        def attempt():
+            started[name] = time.monotonic()
+            try:
+                return fn()
+            finally:
+                started.pop(name, None)
+        return attempt
+
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch")
+    try:
+        futures, limits = {}, {}
+        for name, source in sources.items():
+            fn, limits[name] = source if isinstance(source, tuple) else (source, timeout)
+            futures[pool.submit(with_retries, name, timed(name, fn), retries)] = name
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=POLL, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    errors[futures[future]] = e
+            now = time.monotonic()
+            for future in list(pending):
+                name = futures[future]
+                began = started.get(name)
+                if limits[name] is not None and began is not None and now - began > limits[name]:
+                    errors[name] = TimeoutError(f"{name} did not finish in time")
+                    pending.discard(future)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    results = {name: results[name] for name in sources if name in results}
+    if errors and raise_errors:
+        raise FetchError(errors, results)
+    return results
@@ -1,9 +1,12 @@
 import io
+import warnings
 from datetime import date
-from typing import Optional
+from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from . import cache
 from .utils import most_recent_season, sanitize_date_range
@@ -12,13 +15,31 @@ from .datasources.bref import BRefSession
 session = BRefSession()
 
 
+# dtype of every column on the daily.cgi batting table
+BATTING_RANGE_SCHEMA = {
+    'Name': 'object', 'Age': 'int32', '#days': 'int32', 'Lev': 'category', 'Tm': 'category',
+    'G': 'int32', 'PA': 'int32', 'AB': 'int32', 'R': 'int32', 'H': 'int32', '2B': 'int32',
+    '3B': 'int32', 'HR': 'int32', 'RBI': 'int32', 'BB': 'int32', 'IBB': 'int32', 'SO': 'int32',
+    'HBP': 'int32', 'SH': 'int32', 'SF': 'int32', 'GDP': 'int32', 'SB': 'int32', 'CS': 'int32',
+    'BA': 'float32', 'OBP': 'float32', 'SLG': 'float32', 'OPS': 'float32', 'mlbID': 'Int64',
+}
+# columns parsed as text; everything else is parsed as float ('' is an unlabeled blank column)
+TEXT_COLUMNS = {column for column, dtype in BATTING_RANGE_SCHEMA.items() if dtype in ('object', 'category')} | {''}
+# numpy int dtypes cannot hold NaN; columns with gaps fall back to the nullable equivalent
+NULLABLE = {'int32': 'Int32', 'int64': 'Int64'}
+
+
+def get_html(start_dt: date, end_dt: date) -> bytes:
+    url = "http://www.baseball-reference.com/leagues/daily.cgi?user_team=&bust_cache=&type=b&lastndays=7&dates=fromandto&fromandto={}.{}&level=mlb&franch=&stat=&stat_value=0".format(start_dt, end_dt)
+    return session.get(url).content
+
+
 def get_soup(start_dt: date, end_dt: date) -> BeautifulSoup:
     # get most recent standings if date not specified
     # if((start_dt is None) or (end_dt is None)):
     #    print('Error: a date range needs to be specified')
     #    return None
-    url = "http://www.baseball-reference.com/leagues/daily.cgi?user_team=&bust_cache=&type=b&lastndays=7&dates=fromandto&fromandto={}.{}&level=mlb&franch=&stat=&stat_value=0".format(start_dt, end_dt)
-    s = session.get(url).content
+    s = get_html(start_dt, end_dt)
     # a workaround to avoid beautiful soup applying the wrong encoding
     s = str(s).encode()
     return BeautifulSoup(s, features="lxml")
@@ -45,11 +66,106 @@ def get_table(soup: BeautifulSoup) -> pd.DataFrame:
     return df
 
 
-def batting_stats_range(start_dt: Optional[str] = None, end_dt: Optional[str] = None) -> pd.DataFrame:
+def _cell_text(cell: etree._Element) -> str:
+    return ''.join(cell.itertext()).strip()
+
+
+def get_table_lxml(html: bytes) -> pd.DataFrame:
+    """
+    Streaming equivalent of get_table. Walks the first table's rows with lxml
+    iterparse, writes each cell straight into a preallocated typed column and
+    pulls mlbID out of the row's anchor in the same pass, freeing rows as it goes.
+    """
+    # every data row is a <tr>, so this bounds the row count without parsing
+    capacity = html.count(b'<tr')
+    headings = None
+    columns = None
+    n = 0
+    for _, element in etree.iterparse(io.BytesIO(html), events=('end',), tag=('tr', 'table'), html=True, encoding='utf-8'):
+        if element.tag == 'table':
+            if headings is not None:
+                break
+            continue
+        if headings is None:
+            if element.getparent().tag == 'thead' or element.find('td') is None:
+                headings = [_cell_text(th) for th in element.iterfind('th')][1:]
+                columns = [np.empty(capacity, dtype=object) if h in TEXT_COLUMNS else np.full(capacity, np.nan)
+                           for h in headings]
+                mlbids = np.full(capacity, np.nan)
+            continue
+        cells = element.findall('td')
+        if not cells:
+            continue  # repeated header rows inside tbody
+        for column, cell in zip(columns, cells):
+            text = _cell_text(cell)
+            if column.dtype == object:
+                column[n] = text
+            elif text:
+                try:
+                    column[n] = float(text)
+                except ValueError:
+                    pass
+        anchor = element.find('.//a')
+        if anchor is not None and 'mlb_ID=' in anchor.get('href', ''):
+            mlbids[n] = float(anchor.get('href').split('mlb_ID=')[-1])
+        n += 1
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+    if headings is None:
+        raise IndexError('no stats table found on page')
+    data = {heading: column[:n] for heading, column in zip(headings, columns)}
+    data['mlbID'] = mlbids[:n]
+    return pd.DataFrame(data)
+
+
+def apply_schema(table: pd.DataFrame, schema: Dict[str, str]) -> pd.DataFrame:
+    """
+    Convert a scraped table to the dtypes in `schema` in one pass. All numeric
+    columns are cast to float as a single 2-D block, then each dtype group is cast
+    together. Values that cannot be parsed become NA and are reported per column
+    in a warning and in table.attrs['coercion_failures'].
+    """
+    numeric = [c for c, dtype in schema.items() if c in table.columns and dtype not in ('object', 'category')]
+    block = table[numeric].replace('', np.nan)
+    failures = {}
+    try:
+        values = block.to_numpy(dtype=float)
+    except (TypeError, ValueError):
+        # slow path only when something is unparseable, to find out what
+        coerced = block.apply(pd.to_numeric, errors='coerce')
+        bad = coerced.isna() & block.notna()
+        failures = {c: block.loc[bad[c], c].unique().tolist()[:5] for c in numeric if bad[c].any()}
+        values = coerced.to_numpy(dtype=float)
+    converted = pd.DataFrame(values, columns=numeric, index=table.index)
+
+    for dtype in set(schema[c] for c in numeric):
+        group = [c for c in numeric if schema[c] == dtype]
+        if dtype in NULLABLE:
+            has_na = converted[group].isna().any()
+            exact = [c for c in group if not has_na[c]]
+            converted[exact] = converted[exact].astype(dtype)
+            gaps = [c for c in group if has_na[c]]
+            converted[gaps] = converted[gaps].astype(NULLABLE[dtype])
+        else:
+            converted[group] = converted[group].astype(dtype)
+    table = table.drop(columns=numeric).join(converted)[table.columns]
+    for c, dtype in schema.items():
+        if dtype == 'category' and c in table.columns:
+            table[c] = table[c].astype('category')
+
+    table.attrs['coercion_failures'] = failures
+    if failures:
+        warnings.warn(f"could not parse values in {len(failures)} column(s), set to NA: {failures}")
+    return table
+
+
+def batting_stats_range(start_dt: Optional[str] = None, end_dt: Optional[str] = None, parser: str = 'lxml') -> pd.DataFrame:
     """
     Get all batting stats for a set time range. This can be the past week, the
     month of August, anything. Just supply the start and end date in YYYY-MM-DD
-    format.
+    format. parser='lxml' streams the table with get_table_lxml; parser='bs4'
+    uses the original BeautifulSoup path.
     """
     # make sure date inputs are valid
     start_dt_date, end_dt_date = sanitize_date_range(start_dt, end_dt)
@@ -58,18 +174,16 @@ def batting_stats_range(start_dt: Optional[str] = None, end_dt: Optional[str] =
     if end_dt_date.year < 2008:
         raise ValueError("Year must be 2008 or later")
     # retrieve html from baseball reference
-    soup = get_soup(start_dt_date, end_dt_date)
-    table = get_table(soup)
+    if parser == 'lxml':
+        table = get_table_lxml(get_html(start_dt_date, end_dt_date))
+    else:
+        soup = get_soup(start_dt_date, end_dt_date)
+        table = get_table(soup)
     table = table.dropna(how='all')  # drop if all columns are NA
-    # scraped data is initially in string format.
-    # convert the necessary columns to numeric.
-    for column in ['Age', '#days', 'G', 'PA', 'AB', 'R', 'H', '2B', '3B',
-                    'HR', 'RBI', 'BB', 'IBB', 'SO', 'HBP', 'SH', 'SF', 'GDP',
-                    'SB', 'CS', 'BA', 'OBP', 'SLG', 'OPS', 'mlbID']:
-        #table[column] = table[column].astype('float')
-        table[column] = pd.to_numeric(table[column])
-        #table['column'] = table['column'].convert_objects(convert_numeric=True)
+    # scraped data is initially in string format (or float from the lxml parser).
+    # convert every column to its declared dtype in one pass.
     table = table.drop('', axis=1)
+    table = apply_schema(table, BATTING_RANGE_SCHEMA)
     return table
 
 
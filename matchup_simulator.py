@@ -0,0 +1,171 @@
+"""
+Monte Carlo head-to-head category matchups. Each player's raw stat line is
+turned into per-opportunity rates (per plate appearance, per out recorded) and
+a typical week's playing time; every trial then samples one week for every
+player on both rosters at once, as (trials, players) NumPy arrays, and scores
+the categories the league plays: R, HR, RBI, SB, AVG / W, ERA, WHIP, SO, SV, HLD.
+
+    python matchup_simulator.py --trials 100000 --workers 4
+"""
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from raw_loader import load_raw
+
+# Weeks the stat lines cover (a full season); pass weeks= for shorter windows
+SEASON_WEEKS = 26
+# Approximate opening day (month, day); a season in progress covers the weeks since
+OPENING_DAY = (3, 27)
+# Trials sampled per batch; bounds memory at roughly 10k x roster size per array
+CHUNK_TRIALS = 10_000
+
+HITTER_COUNTS = ['R', 'HR', 'RBI', 'SB']
+PITCHER_COUNTS = ['W', 'SV', 'HLD']
+# Category -> True when the higher team total wins
+CATEGORIES = {
+    'R': True, 'HR': True, 'RBI': True, 'SB': True, 'AVG': True,
+    'W': True, 'ERA': False, 'WHIP': False, 'SO': True, 'SV': True, 'HLD': True,
+}
+
+
+def innings_to_outs(ip):
+    """FanGraphs writes 75.2 for 75 2/3 innings."""
+    ip = np.nan_to_num(np.asarray(ip, dtype=float))
+    whole = np.floor(ip)
+    return whole * 3 + np.round((ip - whole) * 10)
+
+
+def per(numerator, denominator):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator > 0, numerator / denominator, 0.0)
+
+
+def column(frame, name):
+    if name not in frame.columns:
+        return np.zeros(len(frame))
+    return np.nan_to_num(pd.to_numeric(frame[name], errors='coerce').to_numpy(dtype=float, na_value=np.nan))
+
+
+def season_weeks(season, as_of):
+    """Weeks of play behind a season's stat lines as of a date: opening day to as_of, at most SEASON_WEEKS."""
+    elapsed = (date.fromisoformat(as_of) - date(int(season), *OPENING_DAY)).days / 7
+    # At least a week, so the first days of a season don't blow up the weekly rates
+    return min(max(elapsed, 1), SEASON_WEEKS)
+
+
+def roster_rates(hitters, pitchers, weeks=SEASON_WEEKS):
+    """Weekly playing time and per-opportunity rates for one roster's raw stat rows."""
+    pa, ab, hits = column(hitters, 'PA'), column(hitters, 'AB'), column(hitters, 'H')
+    outs = innings_to_outs(column(pitchers, 'IP'))
+    return {
+        'pa': pa / weeks,
+        'ab_per_pa': per(ab, pa),
+        'avg': per(hits, ab),
+        'hitting': np.stack([per(column(hitters, c), pa) for c in HITTER_COUNTS], axis=-1).reshape(len(hitters), len(HITTER_COUNTS)),
+        'outs': outs / weeks,
+        'er_per_out': per(column(pitchers, 'ER'), outs),
+        'baserunners_per_out': per(column(pitchers, 'H') + column(pitchers, 'BB'), outs),
+        'so_per_out': per(column(pitchers, 'SO'), outs),
+        'pitching': np.stack([column(pitchers, c) / weeks for c in PITCHER_COUNTS], axis=-1).reshape(len(pitchers), len(PITCHER_COUNTS)),
+    }
+
+
+def sample_week(rates, trials, rng):
+    """Team category totals for `trials` simulated weeks: {category: (trials,) array}."""
+    n_hitters, n_pitchers = len(rates['pa']), len(rates['outs'])
+    pa = rng.poisson(rates['pa'], size=(trials, n_hitters))
+    ab = rng.binomial(pa, rates['ab_per_pa'])
+    hits = rng.binomial(ab, rates['avg'])
+    counts = rng.poisson(pa[..., None] * rates['hitting'])
+    totals = {c: counts[..., i].sum(axis=1) for i, c in enumerate(HITTER_COUNTS)}
+
+    outs = rng.poisson(rates['outs'], size=(trials, n_pitchers))
+    earned_runs = rng.poisson(outs * rates['er_per_out']).sum(axis=1)
+    baserunners = rng.poisson(outs * rates['baserunners_per_out']).sum(axis=1)
+    totals['SO'] = rng.poisson(outs * rates['so_per_out']).sum(axis=1)
+    pitching = rng.poisson(rates['pitching'], size=(trials, n_pitchers, len(PITCHER_COUNTS))).sum(axis=1)
+    totals.update({c: pitching[:, i] for i, c in enumerate(PITCHER_COUNTS)})
+
+    innings = outs.sum(axis=1) / 3
+    with np.errstate(divide='ignore', invalid='ignore'):
+        totals['AVG'] = hits.sum(axis=1) / ab.sum(axis=1)
+        totals['ERA'] = 9 * earned_runs / innings
+        totals['WHIP'] = baserunners / innings
+    return totals
+
+
+def simulate_chunk(rates_a, rates_b, trials, seed):
+    """
+    Wins and ties per category for team A over `trials` weeks, plus how many
+    weeks A won outright (more categories) and how many were split evenly.
+    """
+    rng = np.random.default_rng(seed)
+    a, b = sample_week(rates_a, trials, rng), sample_week(rates_b, trials, rng)
+    wins, ties = np.zeros(len(CATEGORIES)), np.zeros(len(CATEGORIES))
+    margin = np.zeros(trials)
+    for i, (category, higher) in enumerate(CATEGORIES.items()):
+        # A team with no at-bats or innings that week loses the ratio category
+        worst = -np.inf if higher else np.inf
+        x, y = np.nan_to_num(a[category], nan=worst), np.nan_to_num(b[category], nan=worst)
+        better = x > y if higher else x < y
+        tied = x == y
+        wins[i], ties[i] = better.sum(), tied.sum()
+        margin += better.astype(int) - (~better & ~tied)
+    return wins, ties, (margin > 0).sum(), (margin == 0).sum()
+
+
+def simulate_matchup(team_a, team_b, trials=100_000, weeks=SEASON_WEEKS, workers=None, seed=None):
+    """
+    Category win probabilities for team A against team B. Each team is a
+    (hitters, pitchers) pair of raw stat frames. With workers > 1 the trial
+    batches are spread over a process pool.
+    """
+    rates_a, rates_b = roster_rates(*team_a, weeks), roster_rates(*team_b, weeks)
+    sizes = [CHUNK_TRIALS] * (trials // CHUNK_TRIALS) + ([trials % CHUNK_TRIALS] if trials % CHUNK_TRIALS else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = ([rates_a] * len(sizes), [rates_b] * len(sizes), sizes, seeds)
+    if workers and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(simulate_chunk, *jobs))
+    else:
+        results = list(map(simulate_chunk, *jobs))
+
+    wins = sum(r[0] for r in results)
+    ties = sum(r[1] for r in results)
+    summary = pd.DataFrame({
+        'Category': list(CATEGORIES),
+        'Win %': wins / trials,
+        'Tie %': ties / trials,
+        'Loss %': (trials - wins - ties) / trials,
+    })
+    summary.attrs['matchup_win'] = sum(r[2] for r in results) / trials
+    summary.attrs['matchup_tie'] = sum(r[3] for r in results) / trials
+    summary.attrs['expected_categories'] = (wins + ties / 2).sum() / trials
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time a simulated matchup between two rosters drawn from the saved 2025 frames.")
+    parser.add_argument("--trials", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    # Two rosters of 14 hitters and 6 SP + 3 RP, alternating down the playing-time and saves/holds leaders
+    hitters = load_raw('.csv').sort_values('PA', ascending=False).head(28)
+    pitchers = load_raw('raw.csv')
+    starters = pitchers.sort_values('IP', ascending=False).head(12)
+    relievers = pitchers.drop(starters.index).assign(SVHLD=lambda p: p['SV'] + p['HLD']).sort_values('SVHLD', ascending=False).head(6)
+    pitchers = pd.concat([starters, relievers])
+    team_a = (hitters.iloc[::2], pitchers.iloc[::2])
+    team_b = (hitters.iloc[1::2], pitchers.iloc[1::2])
+    start = time.perf_counter()
+    summary = simulate_matchup(team_a, team_b, args.trials, workers=args.workers, seed=args.seed)
+    print(summary.to_string(index=False))
+    print(f"✅ {args.trials} trials in {time.perf_counter() - start:.2f}s: "
+          f"A wins {summary.attrs['matchup_win']:.1%}, ties {summary.attrs['matchup_tie']:.1%}")
@@ -0,0 +1,143 @@
+import os
+import re
+import unicodedata
+from difflib import get_close_matches
+
+import numpy as np
+import pandas as pd
+
+INDEX_FILE = "player_ids.csv"
+MATCH_COLUMNS = ['source', 'Name', 'Team', 'IDfg', 'match']
+# season is only set on misses: a row unmatched in one season may match in another
+INDEX_COLUMNS = MATCH_COLUMNS + ['season']
+# match value for a position row that found no player in that season's stats
+MISS = 'miss'
+
+SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+TEAM_CUTOFF = 0.8
+LEAGUE_CUTOFF = 0.9
+# Stat columns the position files share with FanGraphs, used to tell apart two
+# players with the same name on the same team
+TIE_COLUMNS = ['G', 'GS', 'AB', 'HR', 'BB']
+
+
+def normalize_name(name):
+    """Lowercase, accent-free, punctuation-free name with generational suffixes dropped."""
+    if not isinstance(name, str):
+        return ''
+    # Position files exported through Excel carry UTF-8 read as cp1252 ("Oâ€™Brien")
+    try:
+        name = name.encode('cp1252').decode('utf-8')
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        pass
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(c for c in name if not unicodedata.combining(c)).lower()
+    name = re.sub(r"[.'’`]", '', name)
+    name = re.sub(r'[^a-z0-9]+', ' ', name)
+    return ' '.join(part for part in name.split() if part not in SUFFIXES)
+
+
+def match_players(stats, positions, source):
+    """
+    Match each position-file row to a FanGraphs IDfg. Tries, in order: exact
+    normalized name on the same team, a normalized name that is unique
+    league-wide, then a close fuzzy match on the same team or league-wide.
+    Two players with the same name on one team are told apart by the stat line
+    closest to the position row's; a row that can't be told apart stays unmatched.
+    """
+    tie_columns = [c for c in TIE_COLUMNS if c in stats.columns and c in positions.columns]
+    stats = stats[['IDfg', 'Name', 'Team'] + tie_columns].dropna(subset=['IDfg']).drop_duplicates('IDfg')
+    stats = stats.reset_index(drop=True)
+    stats_norm = stats['Name'].map(normalize_name)
+    by_name_team = stats.groupby([stats_norm, stats['Team']]).indices
+    ids = stats['IDfg'].to_numpy()
+    stats_ties = stats[tie_columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+    position_ties = positions.reindex(columns=tie_columns).apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+    name_counts = stats_norm.value_counts()
+    by_unique_name = dict(zip(stats_norm, stats['IDfg']))
+    team_names = stats_norm.groupby(stats['Team']).apply(list).to_dict()
+    all_names = list(name_counts.index)
+
+    def on_team(key, ties):
+        candidates = by_name_team[key]
+        if len(candidates) == 1:
+            return ids[candidates[0]]
+        distance = np.nansum(np.abs(stats_ties[candidates] - ties), axis=1) if tie_columns else np.zeros(len(candidates))
+        closest = candidates[distance == distance.min()]
+        return ids[closest[0]] if len(closest) == 1 else None
+
+    rows = []
+    for name, team, ties in zip(positions['Name'], positions['Team'], position_ties):
+        norm = normalize_name(name)
+        if (norm, team) in by_name_team:
+            idfg = on_team((norm, team), ties)
+            if idfg is not None:
+                rows.append((source, name, team, idfg, 'exact'))
+            continue
+        if name_counts.get(norm, 0) == 1:
+            rows.append((source, name, team, by_unique_name[norm], 'name'))
+            continue
+        close = get_close_matches(norm, team_names.get(team, []), n=1, cutoff=TEAM_CUTOFF)
+        if close:
+            idfg = on_team((close[0], team), ties)
+            if idfg is not None:
+                rows.append((source, name, team, idfg, 'fuzzy'))
+            continue
+        close = get_close_matches(norm, all_names, n=2, cutoff=LEAGUE_CUTOFF)
+        if len(close) == 1 and name_counts[close[0]] == 1:
+            rows.append((source, name, team, by_unique_name[close[0]], 'fuzzy'))
+    index = pd.DataFrame(rows, columns=MATCH_COLUMNS)
+    # Prefer the strongest match when two position rows claim the same player
+    strength = index['match'].map({'exact': 0, 'name': 1, 'fuzzy': 2})
+    index = index.loc[strength.sort_values(kind='stable').index].drop_duplicates('IDfg')
+    return index.sort_index()
+
+
+def load_index(path=INDEX_FILE):
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=INDEX_COLUMNS).astype({'IDfg': 'Int64'})
+    index = pd.read_csv(path, dtype={'IDfg': 'Int64', 'season': str}, keep_default_na=False,
+                        na_values={'IDfg': ['']})
+    return index.reindex(columns=INDEX_COLUMNS, fill_value='')
+
+
+def ensure_index(stats, positions, source, path=INDEX_FILE, write=False):
+    """
+    Return the index for `source`, matching only position rows it has not seen
+    before. Rows that find no player are kept as misses for that season, so
+    they aren't fuzzy-matched again against the same stats. Only the snapshot
+    build passes write=True; request paths match new rows in memory and leave
+    the file alone.
+    """
+    season = str(stats['Season'].iloc[0]) if 'Season' in stats.columns and len(stats) else ''
+    index = load_index(path)
+    known = index[(index['source'] == source) & ((index['match'] != MISS) | (index['season'] == season))]
+    current = pd.MultiIndex.from_frame(positions[['Name', 'Team']])
+    seen = pd.MultiIndex.from_frame(known[['Name', 'Team']])
+    new_rows = positions[~current.isin(seen)].drop_duplicates(['Name', 'Team'])
+    if new_rows.empty:
+        return known
+
+    matched = match_players(stats, new_rows, source)
+    # A player still listed under a known (Name, Team) keeps that row; one whose
+    # known row is gone from the file (traded, or moved by an override) takes the new one
+    claimed = known[pd.MultiIndex.from_frame(known[['Name', 'Team']]).isin(current)]
+    matched = matched[~matched['IDfg'].isin(claimed['IDfg'].dropna())].assign(season='')
+    index = index[~((index['source'] == source) & index['IDfg'].isin(matched['IDfg']))]
+    known = known[~known['IDfg'].isin(matched['IDfg'])]
+    found = pd.MultiIndex.from_frame(matched[['Name', 'Team']])
+    new_rows = new_rows[['Name', 'Team']]
+    missed = new_rows[~pd.MultiIndex.from_frame(new_rows).isin(found)]
+    missed = missed.assign(source=source, IDfg=pd.NA, match=MISS, season=season)[INDEX_COLUMNS]
+    added = pd.concat([matched, missed], ignore_index=True).astype({'IDfg': 'Int64'})
+    if write:
+        pd.concat([index, added], ignore_index=True).to_csv(path, index=False)
+    return pd.concat([known, added], ignore_index=True)
+
+
+def attach_ids(positions, index):
+    """Add an integer IDfg column to a position frame from its identity index."""
+    ids = index.loc[index['match'] != MISS, ['Name', 'Team', 'IDfg']].drop_duplicates(['Name', 'Team'])
+    positions = positions.merge(ids, on=['Name', 'Team'], how='left')
+    positions['IDfg'] = positions['IDfg'].astype('Int64')
+    return positions
@@ -0,0 +1,78 @@
+"""
+Build step that materializes the ranked tables for every season and rolling
+timeframe into Parquet snapshots, so the app can serve them without touching
+FanGraphs or Baseball-Reference. Run it once a day (cron, Heroku Scheduler):
+
+    python ranking_snapshots.py
+    python ranking_snapshots.py --as-of 2025-06-15 --timeframes "Last Week" 2025
+"""
+import argparse
+import os
+import shutil
+import tempfile
+from datetime import date
+
+import pandas as pd
+
+from rankings import TIMEFRAME_DAYS, build_rankings
+
+SNAPSHOT_DIR = "snapshots"
+# Bump whenever the ranked frames change shape; older snapshots are then ignored
+SNAPSHOT_VERSION = 1
+SEASONS = ["2025", "2024", "2023"]
+FRAMES = ["pitcher_z_scores_ranked", "hitter_z_scores_ranked", "sortedrank_pitcher_data", "sortedrank_hitter_data"]
+
+
+def snapshot_as_of(selected_season, as_of):
+    """Completed seasons never change, so they are stored under their last day."""
+    if selected_season in TIMEFRAME_DAYS:
+        return as_of
+    return min(as_of, f"{selected_season}-12-31")
+
+
+def snapshot_path(selected_season, as_of, root=SNAPSHOT_DIR):
+    slug = selected_season.lower().replace(" ", "_")
+    return os.path.join(root, f"v{SNAPSHOT_VERSION}", slug, snapshot_as_of(selected_season, as_of))
+
+
+def write_snapshot(frames, selected_season, as_of, root=SNAPSHOT_DIR):
+    """Write all four frames to a temp directory and move it into place in one rename."""
+    path = snapshot_path(selected_season, as_of, root)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=os.path.dirname(path))
+    for name, frame in zip(FRAMES, frames):
+        frame.to_parquet(os.path.join(tmp, f"{name}.parquet"))
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    os.replace(tmp, path)
+    return path
+
+
+def load_snapshot(selected_season, as_of, root=SNAPSHOT_DIR):
+    """The four ranked frames for this season/timeframe and as-of date, or None if not built."""
+    path = snapshot_path(selected_season, as_of, root)
+    if not os.path.isdir(path):
+        return None
+    return tuple(pd.read_parquet(os.path.join(path, f"{name}.parquet")) for name in FRAMES)
+
+
+def build_snapshots(as_of=None, timeframes=None, root=SNAPSHOT_DIR, rebuild=False):
+    as_of = as_of or date.today().isoformat()
+    timeframes = timeframes or SEASONS + list(TIMEFRAME_DAYS)
+    for selected_season in timeframes:
+        if not rebuild and load_snapshot(selected_season, as_of, root) is not None:
+            print(f"⏭️  {selected_season} ({snapshot_as_of(selected_season, as_of)}) already built")
+            continue
+        frames = build_rankings(selected_season, as_of)
+        path = write_snapshot(frames, selected_season, as_of, root)
+        print(f"✅ {selected_season} -> {path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute ranking snapshots.")
+    parser.add_argument("--as-of", default=None, help="YYYY-MM-DD, defaults to today")
+    parser.add_argument("--timeframes", nargs="*", default=None, help="Seasons and/or rolling windows to build")
+    parser.add_argument("--root", default=SNAPSHOT_DIR)
+    parser.add_argument("--rebuild", action="store_true", help="Overwrite snapshots that already exist")
+    args = parser.parse_args()
+    build_snapshots(args.as_of, args.timeframes, args.root, args.rebuild)
@@ -0,0 +1,157 @@
+import pandas as pd
+from datetime import date, timedelta
+
+from roster_corrections import load_overrides, apply_corrections
+from player_index import ensure_index, attach_ids
+from daily_stats import stats_window
+from fetch_orchestrator import fetch_all
+from season_cache import season_source
+from zscores import (PITCHER_CATEGORIES, HITTER_CATEGORIES, PITCHER_VOLUME, HITTER_VOLUME,
+                     zscore_table, ranked)
+
+TIMEFRAME_DAYS = {
+    "Last Week": 7,
+    "Last 2 Weeks": 14,
+    "Last Month": 30,
+}
+
+# Baseball-Reference range pages list teams by city; league disambiguates NY/CHI/LA
+BREF_TEAMS = {
+    ('Baltimore', 'AL'): 'BAL', ('Boston', 'AL'): 'BOS', ('New York', 'AL'): 'NYY',
+    ('Tampa Bay', 'AL'): 'TBR', ('Toronto', 'AL'): 'TOR', ('Chicago', 'AL'): 'CHW',
+    ('Cleveland', 'AL'): 'CLE', ('Detroit', 'AL'): 'DET', ('Kansas City', 'AL'): 'KCR',
+    ('Minnesota', 'AL'): 'MIN', ('Houston', 'AL'): 'HOU', ('Los Angeles', 'AL'): 'LAA',
+    ('Oakland', 'AL'): 'ATH', ('Athletics', 'AL'): 'ATH', ('Sacramento', 'AL'): 'ATH',
+    ('Seattle', 'AL'): 'SEA', ('Texas', 'AL'): 'TEX',
+    ('Atlanta', 'NL'): 'ATL', ('Miami', 'NL'): 'MIA', ('New York', 'NL'): 'NYM',
+    ('Philadelphia', 'NL'): 'PHI', ('Washington', 'NL'): 'WSN', ('Chicago', 'NL'): 'CHC',
+    ('Cincinnati', 'NL'): 'CIN', ('Milwaukee', 'NL'): 'MIL', ('Pittsburgh', 'NL'): 'PIT',
+    ('St. Louis', 'NL'): 'STL', ('Arizona', 'NL'): 'ARI', ('Colorado', 'NL'): 'COL',
+    ('Los Angeles', 'NL'): 'LAD', ('San Diego', 'NL'): 'SDP', ('San Francisco', 'NL'): 'SFG',
+}
+
+
+def timeframe_dates(selected_season, as_of):
+    """Return (start, end) date strings for a rolling timeframe, or None for a full season."""
+    if selected_season not in TIMEFRAME_DAYS:
+        return None
+    end_date = date.fromisoformat(as_of)
+    start_date = end_date - timedelta(days=TIMEFRAME_DAYS[selected_season])
+    return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+
+
+def normalize_bref(stats):
+    """Give a Baseball-Reference range frame the FanGraphs column names the rankings use."""
+    stats = stats.rename(columns={'BA': 'AVG'})
+    # Traded players list every club, e.g. "Chicago,New York"; keep the current one
+    city = stats['Tm'].astype(str).str.split(',').str[-1].str.strip()
+    league = stats['Lev'].astype(str).str.split(',').str[-1].str.strip().str[-2:]
+    stats['Team'] = [BREF_TEAMS.get(key, team) for key, team in zip(zip(city, league), city)]
+    if 'HLD' not in stats.columns:
+        stats['HLD'] = 0
+    return stats
+
+
+def stat_sources(selected_season, as_of):
+    """Fetchers for a season or rolling timeframe, for fetch_all (callables or (callable, timeout))."""
+    date_range = timeframe_dates(selected_season, as_of)
+    if date_range is None:
+        # Completed seasons that were backfilled load from season_cache/ instead
+        return {kind: season_source(selected_season, kind) for kind in ('pitching', 'batting')}
+    start_str, end_str = date_range
+    # Differences of stored season-to-date totals; only unstored or unsettled dates hit the network.
+    # No timeout: the throttled Baseball-Reference session can take minutes on a cold store, and
+    # these write stat_store partitions, so they must not be abandoned mid-write.
+    return {
+        'pitching': (lambda: normalize_bref(stats_window('pitching', start_str, end_str)), None),
+        'batting': (lambda: normalize_bref(stats_window('batting', start_str, end_str)), None),
+    }
+
+
+def fetch_stats(selected_season, as_of):
+    """Raw pitching and batting stats for a season or rolling timeframe, fetched concurrently."""
+    results = fetch_all(stat_sources(selected_season, as_of))
+    return results['pitching'], results['batting']
+
+
+def read_positions():
+    pitcher_positions = pd.read_csv('pitcher_positions.csv')
+    hitter_positions = pd.read_csv("Player Positions.csv")
+    return pitcher_positions, hitter_positions
+
+
+def join_positions(stats, positions, source, write_index=False):
+    """
+    Attach Pos to a stats frame. FanGraphs frames join on the integer IDfg through
+    the persisted identity index; frames without IDfg fall back to Name + Team.
+    write_index=True saves newly matched rows to player_ids.csv.
+    """
+    if 'IDfg' not in stats.columns:
+        return pd.merge(stats, positions[['Name', 'Team', 'Pos']], on = ['Name', 'Team'], how = 'left')
+    index = ensure_index(stats, positions, source, write=write_index)
+    positions = attach_ids(positions, index).dropna(subset=['IDfg']).drop_duplicates('IDfg')
+    return pd.merge(stats, positions[['IDfg', 'Pos']], on = 'IDfg', how = 'left')
+
+
+def prepare_pitchers(pitcher_dat, pitcher_positions, as_of=None, overrides=None, write_index=False):
+    """Reconcile FanGraphs pitching stats with the pitcher position file."""
+    pitcher_positions = pitcher_positions.rename(columns={'ESPN': 'Pos'})
+    pitcher_dat = apply_corrections(pitcher_dat, 'pitcher_stats', as_of, overrides)
+    pitcher_positions = apply_corrections(pitcher_positions, 'pitcher_positions', as_of, overrides)
+    return join_positions(pitcher_dat, pitcher_positions, 'pitcher_positions', write_index)
+
+
+def prepare_hitters(hitter_dat, hitter_positions, as_of=None, overrides=None, write_index=False):
+    """Reconcile FanGraphs batting stats with the hitter position file."""
+    hitter_dat = apply_corrections(hitter_dat, 'hitter_stats', as_of, overrides)
+    hitter_positions = apply_corrections(hitter_positions, 'hitter_positions', as_of, overrides)
+    hitter_data = join_positions(hitter_dat, hitter_positions, 'hitter_positions', write_index)
+    hitter_data.rename(columns={'Pos_y': 'Pos'}, inplace=True)
+    return hitter_data
+
+
+def pitcher_zscores(pitcher_data):
+    """IP-weighted pitcher z-scores, one row per pitcher with IP > 0."""
+    return zscore_table(pitcher_data, PITCHER_CATEGORIES, PITCHER_VOLUME)
+
+
+def hitter_zscores(hitter_data):
+    """PA-weighted hitter z-scores, one row per hitter with PA > 0."""
+    return zscore_table(hitter_data, HITTER_CATEGORIES, HITTER_VOLUME)
+
+
+def rank(z_scores, data):
+    """Sort z-scores by Total Z-Score, add Rank, and carry Rank back onto the raw stats."""
+    z_scores_ranked = ranked(z_scores)
+    # z_scores keeps the row labels of `data`, so Rank aligns back without a join
+    rank_data = data.assign(Rank=z_scores_ranked['Rank'])
+    sortedrank_data = rank_data.sort_values(by='Rank', ascending=True)
+    return z_scores_ranked.reset_index(drop=True), sortedrank_data
+
+
+def rank_all(pitcher_dat, hitter_dat, pitcher_positions, hitter_positions, selected_season, as_of,
+             write_index=False):
+    """
+    Full pipeline from raw stats to (pitcher_z_scores_ranked, hitter_z_scores_ranked,
+    sortedrank_pitcher_data, sortedrank_hitter_data). Only the snapshot build
+    passes write_index=True.
+    """
+    # A completed season should not pick up roster moves made after it ended
+    corrections_as_of = as_of if selected_season in TIMEFRAME_DAYS else min(as_of, f"{selected_season}-12-31")
+    overrides = load_overrides()
+    pitcher_data = prepare_pitchers(pitcher_dat, pitcher_positions, corrections_as_of, overrides, write_index)
+    hitter_data = prepare_hitters(hitter_dat, hitter_positions, corrections_as_of, overrides, write_index)
+
+    pitcher_z_scores_ranked, sortedrank_pitcher_data = rank(pitcher_zscores(pitcher_data), pitcher_data)
+    hitter_z_scores_ranked, sortedrank_hitter_data = rank(hitter_zscores(hitter_data), hitter_data)
+    return pitcher_z_scores_ranked, hitter_z_scores_ranked, sortedrank_pitcher_data, sortedrank_hitter_data
+
+
+def build_rankings(selected_season, as_of):
+    """Fetch and rank a season or timeframe without any caching, saving new player_ids.csv matches."""
+    sources = stat_sources(selected_season, as_of)
+    sources['positions'] = read_positions
+    results = fetch_all(sources)
+    pitcher_positions, hitter_positions = results['positions']
+    return rank_all(results['pitching'], results['batting'], pitcher_positions, hitter_positions, selected_season, as_of,
+                    write_index=True)
@@ -0,0 +1,122 @@
+"""
+Typed loader for the FanGraphs exports bundled with the repo (raw.csv, diw.csv,
+.csv, sample.csv, fullhitterdata.xlsx). Each file's schema is declared once
+below. Currency ("$24.3", "($1.2)") and percent fields are parsed to floats
+while loading, and the result is cached as Parquet under a key derived from the
+source file's hash, so later loads skip parsing and read only the requested
+columns. The matchup simulator's CLI and the benchmarks read the exports
+through here.
+
+    python raw_loader.py            # warm the cache for every bundled file
+"""
+import argparse
+import glob
+import hashlib
+import os
+
+import pandas as pd
+
+from cleaning import clean_numeric
+
+CACHE_DIR = "raw_cache"
+
+# Column kinds: 'id' (nullable int), 'text', 'category', 'int', 'float', 'currency', 'percent'
+PITCHER_SCHEMA = {
+    'IDfg': 'id', 'Season': 'int', 'Name': 'text', 'Team': 'category', 'Age': 'int',
+    'W': 'int', 'L': 'int', 'ERA': 'float', 'G': 'int', 'GS': 'int', 'SV': 'int', 'HLD': 'int',
+    'IP': 'float', 'TBF': 'int', 'H': 'int', 'ER': 'int', 'HR': 'int', 'BB': 'int', 'SO': 'int',
+    'WHIP': 'float', 'FIP': 'float', 'K%': 'percent', 'BB%': 'percent', 'WAR': 'float',
+    'WPA': 'float', '-WPA': 'float', '+WPA': 'float', 'Dollars': 'currency',
+}
+HITTER_SCHEMA = {
+    'IDfg': 'id', 'Season': 'int', 'Name': 'text', 'Team': 'category', 'Age': 'int',
+    'G': 'int', 'AB': 'int', 'PA': 'int', 'H': 'int', 'HR': 'int', 'R': 'int', 'RBI': 'int',
+    'BB': 'int', 'SO': 'int', 'SB': 'int', 'CS': 'int', 'AVG': 'float', 'OBP': 'float',
+    'SLG': 'float', 'OPS': 'float', 'BB%': 'percent', 'K%': 'percent', 'WAR': 'float',
+    'WPA': 'float', '-WPA': 'float', '+WPA': 'float', 'Dol': 'currency',
+}
+
+# file -> (schema, header renames applied before the schema)
+SOURCES = {
+    'raw.csv': (PITCHER_SCHEMA, {}),
+    'diw.csv': (dict(PITCHER_SCHEMA, Pos='category'), {}),
+    '.csv': (dict(HITTER_SCHEMA, Pos_y='category'), {}),
+    # Saved through Excel, which turned the -WPA/+WPA headers into formulas
+    'sample.csv': (dict(HITTER_SCHEMA, Pos_y='category'), {'#NAME?': '-WPA', '#NAME?2': '+WPA'}),
+    'fullhitterdata.xlsx': (HITTER_SCHEMA, {}),
+}
+
+# What rank_all reads from each side, before positions are joined
+PITCHER_RANKING_COLUMNS = ['IDfg', 'Name', 'Team', 'W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD', 'IP']
+HITTER_RANKING_COLUMNS = ['IDfg', 'Name', 'Team', 'R', 'HR', 'RBI', 'SB', 'AVG', 'PA']
+
+DTYPES = {'id': 'Int64', 'text': 'string', 'category': 'category', 'int': 'Int32', 'float': 'float32'}
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def cache_path(name, digest, cache_dir=CACHE_DIR):
+    stem = name.replace('.', '_').strip('_') or 'file'
+    return os.path.join(cache_dir, f"{stem}-{digest}.parquet")
+
+
+def parse_source(path, schema, renames):
+    """Read only the schema's columns from the file and apply the declared dtypes."""
+    wanted = {raw for raw in renames if renames[raw] in schema} | set(schema)
+    read_as_text = {column: str for column, kind in schema.items() if kind in ('currency', 'percent')}
+    if path.endswith('.xlsx'):
+        frame = pd.read_excel(path, usecols=lambda c: c in wanted, dtype=read_as_text)
+    else:
+        frame = pd.read_csv(path, usecols=lambda c: c in wanted, dtype=read_as_text)
+    frame = frame.rename(columns=renames)
+    for column, kind in schema.items():
+        if column not in frame.columns:
+            continue
+        if kind in ('currency', 'percent'):
+            frame[column] = clean_numeric(frame[column]).astype('float32')
+        elif kind in ('id', 'int'):
+            frame[column] = pd.to_numeric(frame[column], errors='coerce').round().astype(DTYPES[kind])
+        else:
+            frame[column] = frame[column].astype(DTYPES[kind])
+    return frame[[column for column in schema if column in frame.columns]]
+
+
+def load_raw(name, columns=None, root='.', cache_dir=CACHE_DIR):
+    """
+    A bundled export as a typed frame, limited to `columns` if given. Parsed on
+    the first load after the file changes; otherwise read from the Parquet cache.
+    """
+    schema, renames = SOURCES[name]
+    path = os.path.join(root, name)
+    cached = cache_path(name, file_hash(path), cache_dir)
+    if not os.path.exists(cached):
+        frame = parse_source(path, schema, renames)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Drop caches of earlier versions of this file
+        for stale in glob.glob(cache_path(name, '*', cache_dir)):
+            os.remove(stale)
+        frame.to_parquet(cached + ".tmp", index=False)
+        os.replace(cached + ".tmp", cached)
+    return pd.read_parquet(cached, columns=columns)
+
+
+def load_ranking_inputs(pitchers='raw.csv', hitters='.csv', root='.', cache_dir=CACHE_DIR):
+    """(pitcher_dat, hitter_dat) with just the columns the rankings read."""
+    return (load_raw(pitchers, PITCHER_RANKING_COLUMNS, root, cache_dir),
+            load_raw(hitters, HITTER_RANKING_COLUMNS, root, cache_dir))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parse the bundled exports into the Parquet cache.")
+    parser.add_argument("files", nargs="*", default=list(SOURCES))
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    args = parser.parse_args()
+    for name in args.files:
+        frame = load_raw(name, cache_dir=args.cache_dir)
+        print(f"✅ {name}: {len(frame)} rows, {frame.memory_usage(deep=True).sum() / 1024:.0f} KiB")
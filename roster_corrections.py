@@ -0,0 +1,49 @@
+import pandas as pd
+
+OVERRIDES_FILE = "roster_overrides.csv"
+
+# roster_overrides.csv holds three kinds of rule, told apart by which fields are set:
+#   name + from_team + to_team  -> move one player's row to a new team (trades, FA signings)
+#   from_team + to_team         -> team code alias applied to every row (WSH -> WSN)
+#   name + new_name             -> spelling fix so names agree across sources
+# Rows with an effective_date only apply once the data's as-of date reaches it.
+
+
+def load_overrides(path=OVERRIDES_FILE):
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+def apply_corrections(df, source, as_of=None, overrides=None):
+    """
+    Apply every override for `source` to the Name/Team columns of `df` in one pass.
+    Team moves are a single left join on (Name, Team); aliases and renames are
+    hash lookups, so the cost stays flat as the override table grows.
+    """
+    if overrides is None:
+        overrides = load_overrides()
+    rules = overrides[overrides['source'] == source]
+    if as_of is not None:
+        rules = rules[(rules['effective_date'] == '') | (rules['effective_date'] <= str(as_of))]
+    # Later rules win when the same key appears twice
+    rules = rules.sort_values('effective_date', kind='stable')
+
+    has_name = rules['name'] != ''
+    has_team = rules['from_team'] != ''
+    moves = rules[has_name & has_team].drop_duplicates(['name', 'from_team'], keep='last')
+    aliases = rules[~has_name & has_team].drop_duplicates('from_team', keep='last')
+    renames = rules[has_name & ~has_team].drop_duplicates('name', keep='last')
+
+    moved = df[['Name', 'Team']].merge(
+        moves[['name', 'from_team', 'to_team']],
+        left_on=['Name', 'Team'], right_on=['name', 'from_team'], how='left',
+    )['to_team'].to_numpy()
+    aliased = df['Team'].map(dict(zip(aliases['from_team'], aliases['to_team'])))
+
+    df = df.copy()
+    # where() instead of fillna(): fillna on object columns warns about silent downcasting
+    team = pd.Series(moved, index=df.index, dtype=object)
+    team = team.where(team.notna(), aliased)
+    df['Team'] = team.where(team.notna(), df['Team'])
+    renamed = df['Name'].map(dict(zip(renames['name'], renames['new_name'])))
+    df['Name'] = renamed.where(renamed.notna(), df['Name'])
+    return df
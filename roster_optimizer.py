@@ -0,0 +1,74 @@
+"""
+Best legal fantasy lineup from the ranked z-score tables. Every player is
+matched to at most one roster slot and every slot to at most one player,
+maximizing the lineup's summed Total Z-Score; scipy's linear_sum_assignment
+solves that matching directly instead of trying combinations.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import linear_sum_assignment
+
+# League roster: (slot, how many)
+SLOT_TEMPLATE = [
+    ('C', 1), ('1B', 1), ('2B', 1), ('SS', 1), ('3B', 1), ('OF', 3), ('UTIL', 1),
+    ('SP', 5), ('RP', 3),
+    ('BN', 4),
+]
+HITTER_SLOTS = {'C', '1B', '2B', 'SS', '3B', 'OF', 'UTIL'}
+PITCHER_SLOTS = {'SP', 'RP'}
+BENCH_SLOT = 'BN'
+# Any hitter fits here
+UTIL_SLOT = 'UTIL'
+# Cost of putting a player in a slot they can't fill. Far above any z-score, so the
+# solver fills as many slots legally as it can before it ever uses one of these,
+# and any it does use are dropped as empty slots afterwards.
+INELIGIBLE = 1e6
+
+
+def slot_list(template=SLOT_TEMPLATE):
+    """The template expanded to one entry per slot, e.g. OF, OF, OF."""
+    return [slot for slot, count in template for _ in range(count)]
+
+
+def eligible_slots(pos, side):
+    """
+    Slots a player can fill. `pos` may list several positions ("SS/2B");
+    hitters also fit UTIL, and everyone fits the bench.
+    """
+    positions = set(re.split(r'[/,\s]+', pos.strip())) if isinstance(pos, str) else set()
+    if side == 'hitter':
+        slots = (positions & HITTER_SLOTS) | {UTIL_SLOT}
+    else:
+        slots = positions & PITCHER_SLOTS
+    return slots | {BENCH_SLOT}
+
+
+def optimize_roster(hitters, pitchers, template=SLOT_TEMPLATE):
+    """
+    The max-Total-Z-Score lineup drawn from the hitter and pitcher z-score
+    tables (any subset of rows, e.g. a user's picks or the whole pool). One row
+    per slot in template order, with a leading Slot column; slots nobody can
+    fill are left with empty player columns. A two-way player's hitter and
+    pitcher rows count as two players, as they do in the Fantasy Team pickers.
+    """
+    pool = pd.concat([hitters.assign(_side='hitter'), pitchers.assign(_side='pitcher')], ignore_index=True)
+    slots = slot_list(template)
+    slot_index = {slot: [i for i, s in enumerate(slots) if s == slot] for slot in set(slots)}
+
+    # Cost matrix: players x slots, -Total Z-Score where eligible
+    value = pool['Total Z-Score'].to_numpy(dtype=float, na_value=np.nan)
+    value = np.nan_to_num(value)
+    cost = np.full((len(pool), len(slots)), INELIGIBLE)
+    for row, (pos, side) in enumerate(zip(pool['Pos'], pool['_side'])):
+        for slot in eligible_slots(pos, side):
+            cost[row, slot_index.get(slot, [])] = -value[row]
+
+    players, assigned = linear_sum_assignment(cost)
+    legal = cost[players, assigned] < INELIGIBLE
+    lineup = pool.iloc[players[legal]].drop(columns='_side')
+    lineup.index = assigned[legal]
+    lineup = lineup.reindex(range(len(slots)))
+    lineup.insert(0, 'Slot', slots)
+    return lineup.reset_index(drop=True)
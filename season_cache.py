@@ -0,0 +1,156 @@
+"""
+On-disk cache of full-season FanGraphs batting and pitching stats (and,
+optionally, Baseball-Reference WAR), one Parquet file per season and kind under
+season_cache/<season>/<kind>.parquet. Completed seasons never change, so once a
+season is cached it is read from disk from then on; the season in progress is
+always fetched live and never written. Backfill many seasons at once:
+
+    python season_cache.py 2015-2025
+    python season_cache.py 2021 2022 2023 --bwar --workers 6
+"""
+import argparse
+import os
+import tempfile
+from datetime import date
+
+import pandas as pd
+from pybaseball import pitching_stats, batting_stats, bwar_bat
+
+from fetch_orchestrator import MAX_WORKERS, RETRIES, fetch_all
+
+CACHE_DIR = "season_cache"
+FETCHERS = {
+    'pitching': lambda season: pitching_stats(season, season, qual=0),
+    'batting': lambda season: batting_stats(season, season, qual=0),
+}
+# Timeout for each attempt at one season; a full FanGraphs season is one large page.
+# The clock starts when a worker picks the season up, so a long backfill queued
+# on a few workers doesn't run later seasons out of time.
+TIMEOUT = 300
+
+
+def season_path(season, kind, root=CACHE_DIR):
+    return os.path.join(root, str(season), f"{kind}.parquet")
+
+
+def is_complete(season, today=None):
+    """A season is complete once its calendar year is over."""
+    today = today or date.today()
+    return int(season) < today.year
+
+
+def load_season(season, kind, root=CACHE_DIR):
+    """One cached season's stats, or None if it hasn't been backfilled."""
+    path = season_path(season, kind, root)
+    if not os.path.exists(path):
+        return None
+    return pd.read_parquet(path)
+
+
+def write_season(frame, season, kind, root=CACHE_DIR):
+    """Write to a temp file next to the target and rename it into place."""
+    path = season_path(season, kind, root)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".parquet")
+    os.close(fd)
+    try:
+        frame.to_parquet(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    return path
+
+
+def season_source(season, kind, root=CACHE_DIR):
+    """Zero-argument fetcher for fetch_all: the cached season if there is one, else FanGraphs."""
+    season = int(season)
+    if os.path.exists(season_path(season, kind, root)):
+        return lambda: load_season(season, kind, root)
+    return lambda: FETCHERS[kind](season)
+
+
+def load_seasons(seasons, kind, root=CACHE_DIR):
+    """Every cached season of one kind stacked into one frame; uncached seasons are left out."""
+    frames = [load_season(season, kind, root) for season in seasons]
+    frames = [frame for frame in frames if frame is not None]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def year_over_year(seasons, kind, stat, root=CACHE_DIR):
+    """One row per player (FanGraphs IDfg and Name), one column per cached season for `stat`."""
+    stats = load_seasons(seasons, kind, root)
+    if stats.empty:
+        return stats
+    return stats.pivot_table(index=['IDfg', 'Name'], columns='Season', values=stat, aggfunc='first')
+
+
+def parse_seasons(specs):
+    """'2015-2025' and '2023' style arguments to a sorted list of years."""
+    seasons = set()
+    for spec in specs:
+        first, _, last = str(spec).partition("-")
+        seasons.update(range(int(first), int(last or first) + 1))
+    return sorted(seasons)
+
+
+def backfill(seasons, bwar=False, max_workers=MAX_WORKERS, retries=RETRIES, root=CACHE_DIR,
+             rebuild=False, today=None):
+    """
+    Fetch every completed season in `seasons` that isn't cached yet, all
+    concurrently on one bounded pool, and write each into the cache. With
+    bwar=True, Baseball-Reference's WAR table (one file covering every year) is
+    pulled once and split by season alongside. Seasons still in progress are
+    skipped. Sources that keep failing are reported and left for the next run.
+    """
+    sources = {}
+    wanted_bwar = []
+    for season in seasons:
+        if not is_complete(season, today):
+            print(f"⏭️  {season} is still in progress, not caching it")
+            continue
+        for kind in FETCHERS:
+            if not rebuild and os.path.exists(season_path(season, kind, root)):
+                print(f"⏭️  {season} {kind} already cached")
+                continue
+            sources[f"{season} {kind}"] = (lambda s=season, k=kind: FETCHERS[k](s), TIMEOUT)
+        if bwar and (rebuild or not os.path.exists(season_path(season, 'bwar', root))):
+            wanted_bwar.append(season)
+    if wanted_bwar:
+        sources['bwar'] = (bwar_bat, TIMEOUT)
+    if not sources:
+        return []
+
+    results = fetch_all(sources, max_workers=max_workers, retries=retries, raise_errors=False)
+    for name in sources:
+        if name not in results:
+            print(f"❌ {name} failed, run the backfill again to retry it")
+
+    written = []
+    for name, frame in results.items():
+        if name == 'bwar':
+            continue
+        season, kind = name.split(" ")
+        written.append(write_season(frame, season, kind, root))
+        print(f"✅ {season} {kind}: {len(frame)} rows")
+    if 'bwar' in results:
+        war = results['bwar']
+        for season in wanted_bwar:
+            rows = war[war['year_ID'] == season].reset_index(drop=True)
+            written.append(write_season(rows, season, 'bwar', root))
+            print(f"✅ {season} bwar: {len(rows)} rows")
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill completed seasons into the local season cache.")
+    parser.add_argument("seasons", nargs="+", help="Years or ranges, e.g. 2015-2025 2012")
+    parser.add_argument("--bwar", action="store_true", help="Also cache Baseball-Reference batting WAR")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--retries", type=int, default=RETRIES)
+    parser.add_argument("--root", default=CACHE_DIR)
+    parser.add_argument("--rebuild", action="store_true", help="Refetch seasons that are already cached")
+    args = parser.parse_args()
+    backfill(parse_seasons(args.seasons), args.bwar, args.workers, args.retries, args.root, args.rebuild)
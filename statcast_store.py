@@ -0,0 +1,199 @@
+"""
+Local pitch-level Statcast store for /filter_stats. Each game date is fetched
+once from Baseball Savant into statcast_store/pitches/game_date=<YYYY-MM-DD>/,
+keeping only the columns the endpoint reads, with compact dtypes. Window
+aggregates are then read back through pyarrow.dataset, so only the requested
+columns and the date partitions inside the window are touched.
+
+Each day's pitches are also rolled up into per-player sums and counts under
+statcast_store/summaries/<pitcher|hitter>/game_date=<YYYY-MM-DD>/, so a window
+mean is sum / count over at most one row per player per day rather than a
+regroup of every pitch.
+"""
+import os
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pybaseball import statcast, playerid_reverse_lookup
+
+from daily_stats import is_final
+from fetch_orchestrator import with_retries
+
+STORE_DIR = "statcast_store"
+# Longest /filter_stats window
+STORE_DAYS = 30
+
+PITCH_SCHEMA = pa.schema([
+    ('pitcher', pa.int32()),
+    ('batter', pa.int32()),
+    ('player_name', pa.string()),  # pitcher, "Last, First" as Savant sends it
+    ('batter_name', pa.string()),
+    ('pitch_type', pa.string()),
+    ('description', pa.string()),
+    ('events', pa.string()),
+    ('release_speed', pa.float32()),
+    ('release_spin_rate', pa.float32()),
+    ('launch_speed', pa.float32()),
+    ('launch_angle', pa.float32()),
+    ('swing', pa.int8()),
+    ('whiff', pa.int8()),
+    ('bip', pa.int8()),      # ball in play, home runs excluded (BABIP denominator)
+    ('bip_hit', pa.int8()),  # hit on a ball in play (BABIP numerator)
+])
+PARTITIONING = ds.partitioning(pa.schema([('game_date', pa.string())]), flavor='hive')
+
+WHIFFS = {'swinging_strike', 'swinging_strike_blocked', 'missed_bunt'}
+SWINGS = WHIFFS | {'foul', 'foul_tip', 'foul_bunt', 'bunt_foul_tip', 'hit_into_play',
+                   'hit_into_play_no_out', 'hit_into_play_score'}
+BIP_HITS = {'single', 'double', 'triple'}
+NOT_BIP = {'home_run', 'sac_bunt', 'sac_bunt_double_play'}
+
+# /filter_stats columns per type: (mean columns, (rate name, numerator, denominator))
+AGGREGATES = {
+    'pitcher': (['release_speed', 'release_spin_rate'], ('whiff', 'whiff', 'swing')),
+    'hitter': (['launch_speed', 'launch_angle'], ('babip', 'bip_hit', 'bip')),
+}
+# Per-player daily summaries: who they are keyed by, and what is summed
+SUMMARY_KEYS = {'pitcher': ('pitcher', 'player_name'), 'hitter': ('batter', 'batter_name')}
+MEASURES = ['release_speed', 'release_spin_rate', 'launch_speed', 'launch_angle']
+FLAGS = ['swing', 'whiff', 'bip', 'bip_hit']
+SUMMARY_SCHEMA = pa.schema(
+    [('id', pa.int32()), ('name', pa.string()), ('pitches', pa.int32()), ('events', pa.int32())]
+    + [(f'{m}_{part}', pa.float64() if part == 'sum' else pa.int32()) for m in MEASURES for part in ('sum', 'count')]
+    + [(flag, pa.int32()) for flag in FLAGS]
+)
+
+
+def partition_path(day, root=STORE_DIR):
+    return os.path.join(root, 'pitches', f"game_date={day}", "part-0.parquet")
+
+
+def summary_path(kind, day, root=STORE_DIR):
+    return os.path.join(root, 'summaries', kind, f"game_date={day}", "part-0.parquet")
+
+
+def write_partition(table, path):
+    # Write beside the partition and rename, so readers never see half a file
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pq.write_table(table, path + ".tmp")
+    os.replace(path + ".tmp", path)
+
+
+def batter_names(ids):
+    """MLBAM id -> "Last, First", from the Chadwick register pybaseball caches locally."""
+    if len(ids) == 0:
+        return {}
+    people = playerid_reverse_lookup(list(ids), key_type='mlbam')
+    names = people['name_last'].str.title() + ', ' + people['name_first'].str.title()
+    return dict(zip(people['key_mlbam'], names))
+
+
+def compact(pitches):
+    """Savant's ~90-column pitch rows down to PITCH_SCHEMA."""
+    pitches = pitches.copy()
+    description = pitches['description'].fillna('')
+    events = pitches['events'].fillna('')
+    in_play = pitches['type'].eq('X') & events.ne('') & ~events.isin(NOT_BIP)
+    pitches['swing'] = description.isin(SWINGS).astype(np.int8)
+    pitches['whiff'] = description.isin(WHIFFS).astype(np.int8)
+    pitches['bip'] = in_play.astype(np.int8)
+    pitches['bip_hit'] = (in_play & events.isin(BIP_HITS)).astype(np.int8)
+    pitches['batter_name'] = pitches['batter'].map(batter_names(pitches['batter'].dropna().unique()))
+    return pa.Table.from_pandas(pitches[PITCH_SCHEMA.names], schema=PITCH_SCHEMA, preserve_index=False)
+
+
+def fetch_day(day):
+    """One game date's pitches; an off day yields an empty table so it is not refetched."""
+    pitches = with_retries(f"statcast {day}", lambda: statcast(start_dt=day, end_dt=day, verbose=False))
+    if pitches is None or pitches.empty:
+        return PITCH_SCHEMA.empty_table()
+    return compact(pitches)
+
+
+def update_store(start_dt, end_dt, root=STORE_DIR):
+    """Fetch every day in [start_dt, end_dt] whose partition is missing or provisional."""
+    start, end = date.fromisoformat(start_dt), date.fromisoformat(end_dt)
+    fetched = []
+    for offset in range((end - start).days + 1):
+        day = (start + timedelta(days=offset)).isoformat()
+        path = partition_path(day, root)
+        if is_final(path, day):
+            continue
+        write_partition(fetch_day(day), path)
+        fetched.append(day)
+    return fetched
+
+
+def summarize_day(pitches, kind):
+    """One day's pitches as one row per player: sums and non-null counts per measure, summed flags."""
+    key, name = SUMMARY_KEYS[kind]
+    pitches = pitches.dropna(subset=[key])
+    grouped = pitches.groupby(key, sort=False)
+    summary = pd.DataFrame({'name': grouped[name].last(), 'pitches': grouped.size(),
+                            'events': grouped['events'].count()})
+    for measure in MEASURES:
+        summary[f'{measure}_sum'] = grouped[measure].sum()
+        summary[f'{measure}_count'] = grouped[measure].count()
+    summary[FLAGS] = grouped[FLAGS].sum()
+    summary = summary.rename_axis('id').reset_index()
+    return pa.Table.from_pandas(summary[SUMMARY_SCHEMA.names], schema=SUMMARY_SCHEMA, preserve_index=False)
+
+
+def update_summaries(start_dt, end_dt, root=STORE_DIR):
+    """Rebuild the daily summaries for any day whose pitch partition is newer than them."""
+    start, end = date.fromisoformat(start_dt), date.fromisoformat(end_dt)
+    updated = []
+    for offset in range((end - start).days + 1):
+        day = (start + timedelta(days=offset)).isoformat()
+        source = partition_path(day, root)
+        if not os.path.exists(source):
+            continue
+        targets = {kind: summary_path(kind, day, root) for kind in SUMMARY_KEYS}
+        if all(os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(source)
+               for path in targets.values()):
+            continue
+        pitches = pq.read_table(source).to_pandas()
+        for kind, path in targets.items():
+            write_partition(summarize_day(pitches, kind), path)
+        updated.append(day)
+    return updated
+
+
+def refresh(as_of=None, days=STORE_DAYS, root=STORE_DIR):
+    """Scheduler job: bring the last `days` game dates up to date."""
+    end = date.fromisoformat(as_of) if as_of else date.today()
+    start_dt, end_dt = (end - timedelta(days=days)).isoformat(), end.isoformat()
+    fetched = update_store(start_dt, end_dt, root)
+    summarized = update_summaries(start_dt, end_dt, root)
+    print(f"✅ Statcast store updated ({len(fetched)} days fetched, {len(summarized)} summarized)")
+    return fetched
+
+
+def window_aggregate(kind, start_dt, end_dt, root=STORE_DIR):
+    """
+    Per-player means over [start_dt, end_dt] from the daily summaries, plus the
+    whiff (pitchers) or BABIP (hitters) rate as a ratio of summed flags.
+    """
+    means, (rate, numerator, denominator) = AGGREGATES[kind]
+    columns = ['player_name', 'pitches'] + means + [rate]
+    path = os.path.join(root, 'summaries', kind)
+    if not os.path.isdir(path):
+        return pd.DataFrame(columns=columns)
+    dataset = ds.dataset(path, format='parquet', partitioning=PARTITIONING)
+    window = (ds.field('game_date') >= start_dt) & (ds.field('game_date') <= end_dt)
+    summed = ['pitches', numerator, denominator] + [f'{m}_{part}' for m in means for part in ('sum', 'count')]
+    days = dataset.to_table(columns=['id', 'name'] + summed, filter=window).to_pandas()
+
+    # Day rows are in date order, so 'last' is the player's latest name
+    grouped = days.groupby('id', sort=False)
+    totals = grouped[summed].sum()
+    totals['player_name'] = grouped['name'].last()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for measure in means:
+            totals[measure] = totals[f'{measure}_sum'] / totals[f'{measure}_count'].replace(0, np.nan)
+        totals[rate] = totals[numerator] / totals[denominator].replace(0, np.nan)
+    return totals.dropna(subset=['player_name']).reset_index(drop=True)[columns]
@@ -1,237 +1,29 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
-from pybaseball import pitching_stats, batting_stats, pitching_stats_range, batting_stats_range
-from datetime import datetime, timedelta
+from datetime import date
+
+from draft_session import DraftSession, DEFAULT_TEAMS
+from data_layer import load_rankings, load_top_players, load_z_score_css, simulate
+from roster_optimizer import optimize_roster
+from styling import style_z_scores, z_score_css
+from trade_analyzer import CATEGORY_COLUMNS, batch_trades, category_needs, evaluate_trade, roster_z
+from zscores import top_k
 
 # --- Season and Timeframe Dropdown ---
 season_options = ["2025", "2024", "2023", "Last Week", "Last 2 Weeks", "Last Month"]
 selected_season = st.sidebar.selectbox("Select Season or Timeframe:", season_options)
 
-# --- Handle Date Ranges ---
-end_date = datetime.today()
-if selected_season == "Last Week":
-    start_date = end_date - timedelta(days=7)
-elif selected_season == "Last 2 Weeks":
-    start_date = end_date - timedelta(days=14)
-elif selected_season == "Last Month":
-    start_date = end_date - timedelta(days=30)
-else:
-    start_date = None  # For full season
-
-# --- Fetch Data --
-if start_date is None:
-    pitcher_dat = pitching_stats(int(selected_season), int(selected_season), qual=0)
-    hitter_dat = batting_stats(int(selected_season), int(selected_season), qual=0)
-else:
-    start_str = start_date.strftime("%Y-%m-%d")
-    end_str = end_date.strftime("%Y-%m-%d")
-    pitcher_dat = pitching_stats_range(start_str, end_str)
-    hitter_dat = batting_stats_range(start_str, end_str)
-
-pitcher_positions = pd.read_csv('pitcher_positions.csv')
-pitcher_positions.rename(columns={'ESPN': 'Pos'}, inplace=True)
-
-# Changes to pitcher_dat
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Alexis Diaz') & (pitcher_dat['Team'] == 'CIN'), 'Team'] = 'LAD'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Ian Anderson') & (pitcher_dat['Team'] == 'LAA'), 'Team'] = 'ATL'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Jason Alexander') & (pitcher_dat['Team'] == 'ATH'), 'Team'] = 'HOU'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Josh Walker') & (pitcher_dat['Team'] == 'TOR'), 'Team'] = 'PHI'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Kenta Maeda') & (pitcher_dat['Team'] == 'DET'), 'Team'] = 'CHC'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Kevin Herget') & (pitcher_dat['Team'] == 'NYM'), 'Team'] = 'ATL'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Kyle Gibson') & (pitcher_dat['Team'] == 'BAL'), 'Team'] = 'TBR'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Matt Krook') & (pitcher_dat['Team'] == 'ATH'), 'Team'] = 'CLE'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Noah Murdock') & (pitcher_dat['Team'] == 'ATH'), 'Team'] = 'KCR'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Michael Fulmer') & (pitcher_dat['Team'] == 'BOS'), 'Team'] = 'CHC'#
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Tayler Scott') & (pitcher_dat['Team'] == 'HOU'), 'Team'] = 'ARI'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Tyler Matzek') & (pitcher_dat['Team'] == 'NYY'), 'Team'] = 'STL'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Colin Poche') & (pitcher_dat['Team'] == 'WSN'), 'Team'] = 'NYM'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Lucas Sims') & (pitcher_dat['Team'] == 'WSN'), 'Team'] = 'PHI'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Casey Lawrence') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'SEA'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Hector Neris') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'LAA'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Jose Castillo') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'NYM'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Jose Urena') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'LAD'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Lou Trivino') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'LAD'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Rafael Montero') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'ATL'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Scott Blewett') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'ATL'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Sean Newcomb') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'ATH'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Yoendrys Gomez') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'CHW'
-pitcher_dat.loc[(pitcher_dat['Name'] == 'Genesis Cabrera') & (pitcher_dat['Team'] == '- - -'), 'Team'] = 'CHC'
-
-
-# Changes to pitcher_positions
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Carl Edwards Jr.') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'CHC'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Brooks Kriske') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'LAA'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Cody Bolton') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'CLE'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Joe Mantiply') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'ARI'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Jose Ruiz') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'PHI'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Julian Merryweather') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'CHC'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Tanner Rainey') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'PIT'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Triston McKenzie') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'CLE'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Tyler Alexander') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'MIL'
-pitcher_positions.loc[(pitcher_positions['Name'] == 'Xzavion Curry') & (pitcher_positions['Team'] == 'FA'), 'Team'] = 'MIA'
-
-
-team_replacements_pitcher = {
-    'WSH': 'WSN',#
-    'CWS': 'CHW',
-    'TB': 'TBR',#
-    'SD': 'SDP',#
-    'SF': 'SFG',#
-    'KC': 'KCR',#
-}
-pitcher_positions['Team'] = pitcher_positions['Team'].replace(team_replacements_pitcher)
-
-name_replacements_pitcher = {
-    'AJ Blubaugh': 'A.J. Blubaugh',
-    'Jack Dreyer': 'Jacob Dreyer',
-    'Jake Eder': 'Jacob Eder',
-    'Jacob Latz': 'Jake Latz',
-    'Louis Varland': 'Louie Varland',
-    'Pat Monteverde': 'Patrick Monteverde',
-    "Riley Oâ€™Brien": "Riley O'Brien",
-    'Thomas Harrington': 'Tom Harrington',
-    'Yerry De los Santos': 'Yerry De Los Santos',
-    'Zach Agnos': 'Zachary Agnos',
-    'Brad Lord': 'Bradley Lord',
-    'Michael Soroka': 'Mike Soroka'
-}
-
-pitcher_positions['Name'] = pitcher_positions['Name'].replace(name_replacements_pitcher)
-
-pitcher_data = pd.merge(pitcher_dat, pitcher_positions[['Name', 'Team', 'Pos']], on = ['Name', 'Team'], how = 'left')
-
-
-#Replace Teams: WSH with WSN, CWS with CHW, TB with TBR, SD with SDP, SF with SFG, KC with KCR, 
-#Replace Ben Williamson with Benjamin Williamson, Bobby Witt with Bobby Witt Jr., CJ Alexander with C.J. Alexander
-#Replace DaShawn Keirsey with DaShawn Keirsey Jr., Jackson Chourio with Jazz Chisholm Jr., Leo Rivas with Leonardo Rivas
-#Replace Lourdes Gurriel with Lourdes Gurriel Jr., Michael Harris with Michael Harris II, Nick Kurtz with Nicholas Kurtz
-#Replace Ronald Acuna with Ronald Acuna Jr., Victor Scott with Victor Scott II, Vladimir Guerrero with Vladimir Guerrero Jr., 
-#Replace Vladimir Guerrero with Vladimir Guerrero Jr., Zach Dezenzo with Zachary Dezenzo
-hitter_positions = pd.read_csv("Player Positions.csv")
-name_mistakes_hitter = {
-    'Jack WInkler': 'Jack Winkler',
-
-}
-hitter_dat['Name'] = hitter_dat['Name'].replace(name_mistakes_hitter)
-team_replacements_hitter = {
-    'WSH': 'WSN',
-    'CWS': 'CHW',
-    'TB': 'TBR',
-    'SD': 'SDP',
-    'SF': 'SFG',
-    'KC': 'KCR',
-}
-hitter_positions['Team'] = hitter_positions['Team'].replace(team_replacements_hitter)
-# Replace player names
-name_replacements_hitter = {
-    'Ben Williamson': 'Benjamin Williamson',
-    'Bobby Witt': 'Bobby Witt Jr.',
-    'CJ Alexander': 'C.J. Alexander',
-    'DaShawn Keirsey': 'DaShawn Keirsey Jr.',
-    'Leo Rivas': 'Leonardo Rivas',
-    'Lourdes Gurriel': 'Lourdes Gurriel Jr.',
-    'Michael Harris': 'Michael Harris II',
-    'Nick Kurtz': 'Nicholas Kurtz',
-    'Ronald Acuna': 'Ronald Acuna Jr.',
-    'Victor Scott': 'Victor Scott II',
-    'Vladimir Guerrero': 'Vladimir Guerrero Jr.',
-    'Zach Dezenzo': 'Zachary Dezenzo',
-    'Fernando Tatis': 'Fernando Tatis Jr.',
-    'LaMonte Wade': 'LaMonte Wade Jr.',
-    'Luis Garcia': 'Luis Garcia Jr.',
-    'Luis Robert': 'Luis Robert Jr.',
-    'Michael Taylor': 'Michael A. Taylor',
-    'Robert Hassell': 'Robert Hassell III',
-    'Jazz Chisholm': 'Jazz Chisholm Jr.',
-    'Tim Elko': 'Timothy Elko'
-}
-
-hitter_positions['Name'] = hitter_positions['Name'].replace(name_replacements_hitter)
-
-hitter_data = pd.merge(hitter_dat, hitter_positions[['Name', 'Team', 'Pos']], on = ['Name', 'Team'], how = 'left')
-hitter_data.rename(columns={'Pos_y': 'Pos'}, inplace=True)
-
-# --- Pitcher Z-Scores ---
-pitcher_categories = ['Name','Team', 'Pos', 'W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD','IP']
-pitcher_data_categories = pitcher_data[pitcher_categories]
-pitcher_data_filtered = pitcher_data_categories[pitcher_data_categories['IP'] > 0]
-pitcher_stats_mean = pitcher_data_filtered.drop(columns=['Name','Team', 'Pos',]).mean()
-pitcher_stats_std = pitcher_data_filtered.drop(columns=['Name','Team', 'Pos',]).std()
-pitcher_numeric_columns = ['W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD']
-pitcher_z_scores = (pitcher_data_filtered[pitcher_numeric_columns] - pitcher_stats_mean[pitcher_numeric_columns]) / pitcher_stats_std[pitcher_numeric_columns]
-pitcher_data_filtered['Weighted_ERA'] = (pitcher_data_filtered['ERA'] - pitcher_stats_mean['ERA']) / (pitcher_stats_std['ERA'] / (pitcher_data_filtered['IP'] ** 0.5))
-pitcher_z_scores['ERA'] = (pitcher_data_filtered['Weighted_ERA'] - pitcher_data_filtered['Weighted_ERA'] .mean()) / pitcher_data_filtered['Weighted_ERA'] .std()
-pitcher_data_filtered['Weighted_WHIP'] = (pitcher_data_filtered['WHIP'] - pitcher_stats_mean['WHIP']) / (pitcher_stats_std['WHIP'] / (pitcher_data_filtered['IP'] ** 0.5))
-pitcher_z_scores['WHIP'] = (pitcher_data_filtered['Weighted_WHIP'] - pitcher_data_filtered['Weighted_WHIP'] .mean()) / pitcher_data_filtered['Weighted_WHIP'] .std()
-pitcher_z_scores['ERA'] *= -1
-pitcher_z_scores['WHIP'] *= -1
-pitcher_z_scores.insert(0, 'Name', pitcher_data_filtered['Name'])
-pitcher_z_scores.insert(1, 'Team', pitcher_data_filtered['Team'])
-pitcher_z_scores.insert(2, 'Pos', pitcher_data_filtered['Pos'])
-
-# --- Hitter Z-Scores ---
-hitter_categories = ['Name','Team', 'Pos', 'R', 'HR', 'RBI', 'SB', 'AVG', 'PA']
-hitter_data_categories = hitter_data[hitter_categories]
-hitter_data_filtered = hitter_data_categories[hitter_data_categories['PA'] > 0]
-hitter_stats_mean = hitter_data_filtered.drop(columns=['Name','Team', 'Pos']).mean()
-hitter_stats_std = hitter_data_filtered.drop(columns=['Name','Team', 'Pos']).std()
-hitter_numeric_columns = ['R', 'HR', 'RBI', 'SB', 'AVG']
-hitter_z_scores = (hitter_data_filtered[hitter_numeric_columns] - hitter_stats_mean[hitter_numeric_columns]) / hitter_stats_std[hitter_numeric_columns]
-hitter_data_filtered['Weighted_AVG'] = (hitter_data_filtered['AVG'] - hitter_stats_mean['AVG']) / (hitter_stats_std['AVG'] / (hitter_data_filtered['PA'] ** 0.5))
-hitter_z_scores['AVG'] = (hitter_data_filtered['Weighted_AVG'] - hitter_data_filtered['Weighted_AVG'] .mean()) / hitter_data_filtered['Weighted_AVG'] .std()
-hitter_z_scores.insert(0, 'Name', hitter_data_filtered['Name'])
-hitter_z_scores.insert(1, 'Team', hitter_data_filtered['Team'])
-hitter_z_scores.insert(2, 'Pos', hitter_data_filtered['Pos'])
-
-# --- Total Z-Scores ---
-pitcher_z_scores['Total Z-Score'] = pitcher_z_scores[pitcher_numeric_columns].sum(axis=1)
-hitter_z_scores['Total Z-Score'] = hitter_z_scores[hitter_numeric_columns].sum(axis=1)
-
-# --- Rank and Save ---
-pitcher_z_scores_ranked = pitcher_z_scores.sort_values(by='Total Z-Score', ascending=False)
-hitter_z_scores_ranked = hitter_z_scores.sort_values(by='Total Z-Score', ascending=False)
-pitcher_z_scores_ranked.to_csv("pitcher_z_scores.csv", index=False)
-hitter_z_scores_ranked.to_csv("hitter_z_scores.csv", index=False)
-pitcher_z_scores_ranked = pd.read_csv("pitcher_z_scores.csv")
-hitter_z_scores_ranked = pd.read_csv("hitter_z_scores.csv")
-pitcher_z_scores_ranked.insert(0, "Rank", pitcher_z_scores_ranked.index + 1)
-hitter_z_scores_ranked.insert(0, "Rank", hitter_z_scores_ranked.index + 1)
-rank_hitter_data = pd.merge(hitter_data, hitter_z_scores_ranked[['Name', 'Team', 'Rank']], on = ['Name', 'Team'], how='left')
-sortedrank_hitter_data = rank_hitter_data.sort_values(by='Rank', ascending=True)
-rank_pitcher_data = pd.merge(pitcher_data, pitcher_z_scores_ranked[['Name', 'Team', 'Rank']], on = ['Name', 'Team'], how='left')
-sortedrank_pitcher_data = rank_pitcher_data.sort_values(by='Rank', ascending=True)
+# --- Load Data (cached per season/timeframe and as-of date) ---
+as_of = date.today().isoformat()
+pitcher_z_scores_ranked, hitter_z_scores_ranked, sortedrank_pitcher_data, sortedrank_hitter_data = load_rankings(selected_season, as_of)
+top_pitchers, top_hitters, top_pitchers_raw, top_hitters_raw = load_top_players(selected_season, as_of)
+pitcher_css, hitter_css = load_z_score_css(selected_season, as_of)
 
 # --- Streamlit UI ---
 st.title("Baseball Player Z-Score Rankings")
 stat_type = st.sidebar.radio("Select Stat Type", ["Raw Stats", "Z-Scores"])
-tab1, tab2, tab3, tab4 = st.tabs(["🔍 Player Lookup", "🏆 Top 100 Players", "📊 Team Overview", "🎮 Fantasy Team"])
-
-import math  # for math.isnan
-
-def color_z_scores(val):      
-    try:
-        # Handle None or NaN explicitly
-        if val is None or (isinstance(val, float) and math.isnan(val)):
-            return ""  # no style for None/NaN
-        
-        val = float(val)
-        if val >= 2.5:
-            color = "#006400"  # dark green
-        elif val >= 1.5:
-            color = "#008000"  # green
-        elif val >= 0.5:
-            color = "#32CD32"  # light green
-        elif val >= -0.5:
-            color = "#FFFFFF"  # white
-        elif val >= -1.5:
-            color = "#FFA07A"  # light red
-        elif val >= -2.5:
-            color = "#FF0000"  # red
-        else:
-            color = "#8B0000"  # dark red
-        return f"background-color: {color}; color: black;"
-    except:
-        return "" 
+tab1, tab2, tab3, tab4, tab5 = st.tabs(["🔍 Player Lookup", "🏆 Top 100 Players", "📊 Team Overview", "🎮 Fantasy Team", "📝 Draft Assistant"])
 
 with tab1:
     player_type = st.sidebar.radio("Select Player Type", ["Pitcher", "Hitter"])
@@ -246,7 +38,7 @@ with tab1:
         if stat_type == "Z-Scores":
             zscore_cols = ['W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD']
             df_to_show = player_stats[['Rank','Name', 'Pos', 'Team'] + zscore_cols + ['Total Z-Score']]
-            styled_df = df_to_show.style.applymap(color_z_scores, subset=zscore_cols)
+            styled_df = style_z_scores(df_to_show, zscore_cols, pitcher_css)
             st.dataframe(styled_df, hide_index=True)
         else:
             raw_player_stats = sortedrank_pitcher_data[sortedrank_pitcher_data['Name'] == selected_player]
@@ -265,7 +57,7 @@ with tab1:
         if stat_type == "Z-Scores":
             zscore_cols = ['R', 'HR', 'RBI', 'SB', 'AVG']
             df_to_show = player_stats[['Rank', 'Name', 'Pos', 'Team'] + zscore_cols + ['Total Z-Score']]
-            styled_df = df_to_show.style.applymap(color_z_scores, subset=zscore_cols)
+            styled_df = style_z_scores(df_to_show, zscore_cols, hitter_css)
             st.dataframe(styled_df, hide_index=True)
         else:
             raw_player_stats = sortedrank_hitter_data[sortedrank_hitter_data['Name'] == selected_player]
@@ -281,18 +73,15 @@ with tab2:
     pitcher_positions = pitcher_z_scores_ranked['Pos'].dropna().unique()
     selected_pitcher_pos = st.selectbox("Filter Pitchers by Position:", ['All'] + sorted(pitcher_positions), key='pitcher_pos_filter')
 
-    if selected_pitcher_pos != 'All':
-        filtered_pitchers = pitcher_z_scores_ranked[pitcher_z_scores_ranked['Pos'] == selected_pitcher_pos].head(100)
-        filtered_pitchers_raw = sortedrank_pitcher_data[sortedrank_pitcher_data['Pos'] == selected_pitcher_pos].head(100)
-    else:
-        filtered_pitchers = pitcher_z_scores_ranked.head(100)
-        filtered_pitchers_raw = sortedrank_pitcher_data.head(100)
+    pitcher_slice = ('pos', selected_pitcher_pos) if selected_pitcher_pos != 'All' else ('all', None)
+    filtered_pitchers = pitcher_z_scores_ranked.iloc[top_pitchers.get(pitcher_slice, [])]
+    filtered_pitchers_raw = sortedrank_pitcher_data.iloc[top_pitchers_raw.get(pitcher_slice, [])]
 
     if stat_type == "Z-Scores":
         zscore_cols = ['W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD']
         df = filtered_pitchers[['Rank', 'Name', 'Pos', 'Team', 'Total Z-Score'] + zscore_cols]
         df = df[[col for col in df.columns if col != 'Total Z-Score'] + ['Total Z-Score']]
-        styled_df = df.style.applymap(color_z_scores, subset=zscore_cols)
+        styled_df = style_z_scores(df, zscore_cols, pitcher_css)
         st.dataframe(styled_df, hide_index=True)
     else:
         st.dataframe(filtered_pitchers_raw[['Rank', 'Name', 'Pos', 'Team', 'W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD']].style.format({
@@ -305,18 +94,15 @@ with tab2:
     hitter_positions = hitter_z_scores_ranked['Pos'].dropna().unique()
     selected_hitter_pos = st.selectbox("Filter Hitters by Position:", ['All'] + sorted(hitter_positions), key='hitter_pos_filter')
 
-    if selected_hitter_pos != 'All':
-        filtered_hitters = hitter_z_scores_ranked[hitter_z_scores_ranked['Pos'] == selected_hitter_pos].head(100)
-        filtered_hitters_raw = sortedrank_hitter_data[sortedrank_hitter_data['Pos'] == selected_hitter_pos].head(100)
-    else:
-        filtered_hitters = hitter_z_scores_ranked.head(100)
-        filtered_hitters_raw = sortedrank_hitter_data.head(100)
+    hitter_slice = ('pos', selected_hitter_pos) if selected_hitter_pos != 'All' else ('all', None)
+    filtered_hitters = hitter_z_scores_ranked.iloc[top_hitters.get(hitter_slice, [])]
+    filtered_hitters_raw = sortedrank_hitter_data.iloc[top_hitters_raw.get(hitter_slice, [])]
 
     if stat_type == "Z-Scores":
         zscore_cols = ['R', 'HR', 'RBI', 'SB', 'AVG']
         df = filtered_hitters[['Rank', 'Name', 'Pos', 'Team', 'Total Z-Score'] + zscore_cols]
         df = df[[col for col in df.columns if col != 'Total Z-Score'] + ['Total Z-Score']]
-        styled_df = df.style.applymap(color_z_scores, subset=zscore_cols)
+        styled_df = style_z_scores(df, zscore_cols, hitter_css)
         st.dataframe(styled_df, hide_index=True)
     else:
         st.dataframe(filtered_hitters_raw[['Rank', 'Name', 'Pos', 'Team', 'R', 'HR', 'RBI', 'SB', 'AVG']].style.format({
@@ -336,7 +122,7 @@ with tab3:
         if stat_type == "Z-Scores":
             zscore_cols = ['W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD']
             display_cols = ['Rank', 'Name', 'Pos'] + zscore_cols + ['Total Z-Score']
-            styled_df = team_pitchers[display_cols].style.applymap(color_z_scores, subset=zscore_cols)
+            styled_df = style_z_scores(team_pitchers[display_cols], zscore_cols, pitcher_css)
             st.dataframe(styled_df, hide_index=True)
         else:
             raw_player_stats = sortedrank_pitcher_data[sortedrank_pitcher_data['Team'] == selected_team]
@@ -351,7 +137,7 @@ with tab3:
         if stat_type == "Z-Scores":
             zscore_cols = ['R', 'HR', 'RBI', 'SB', 'AVG']
             display_cols = ['Rank', 'Name', 'Pos'] + zscore_cols + ['Total Z-Score']
-            styled_df = team_hitters[display_cols].style.applymap(color_z_scores, subset=zscore_cols) 
+            styled_df = style_z_scores(team_hitters[display_cols], zscore_cols, hitter_css)
             st.dataframe(styled_df, hide_index=True)
         else:
             raw_player_stats = sortedrank_hitter_data[sortedrank_hitter_data['Team'] == selected_team]
@@ -381,10 +167,137 @@ with tab4:
 
         mask = selected_players["Name"] != "TOTAL"
         # Apply styling only to non-TOTAL rows, and exclude "Total Z-Score"
-        styled_df = selected_players.style \
-            .applymap(lambda val: color_z_scores(val), subset=pd.IndexSlice[mask, zscore_cols]) \
+        styled_df = style_z_scores(selected_players, zscore_cols, z_score_css(selected_players, zscore_cols, mask)) \
             .format({
                 "Rank": "{:.0f}",  # No decimals for Rank
             })
 
         st.dataframe(styled_df, hide_index=True)
+
+    st.write("### Optimal Lineup")
+    lineup_pool = st.radio("Build the lineup from", ["Selected players", "All players"], horizontal=True, key="lineup_pool")
+    if lineup_pool == "All players":
+        lineup = optimize_roster(hitter_z_scores_ranked, pitcher_z_scores_ranked)
+    else:
+        lineup = optimize_roster(hitter_z_scores_ranked[hitter_z_scores_ranked["Name"].isin(selected_hitters)],
+                                 pitcher_z_scores_ranked[pitcher_z_scores_ranked["Name"].isin(selected_pitchers)])
+    filled = lineup["Name"].notna()
+
+    if filled.any():
+        st.write(f"Lineup Total Z-Score: {lineup['Total Z-Score'].sum():.2f} ({filled.sum()} of {len(lineup)} slots filled)")
+        cols = [col for col in lineup.columns if col != "Total Z-Score"] + ["Total Z-Score"]
+        lineup = lineup[cols]
+        zscore_cols = [col for col in ['W', 'ERA', 'WHIP', 'SO', 'SV', 'HLD', 'R', 'HR', 'RBI', 'SB', 'AVG'] if col in lineup.columns]
+        styled_df = style_z_scores(lineup, zscore_cols, z_score_css(lineup, zscore_cols, filled)) \
+            .format({
+                "Rank": "{:.0f}",
+            })
+        st.dataframe(styled_df, hide_index=True)
+
+    st.write("### Matchup Simulator")
+    opponent_pitchers = st.multiselect("Opponent Pitchers", pitcher_z_scores_ranked["Name"], key="opponent_pitcher_select")
+    opponent_hitters = st.multiselect("Opponent Hitters", hitter_z_scores_ranked["Name"], key="opponent_hitter_select")
+    trials = st.select_slider("Simulated weeks", options=[10_000, 25_000, 50_000, 100_000], value=10_000, key="matchup_trials")
+
+    if (selected_hitters or selected_pitchers) and (opponent_hitters or opponent_pitchers):
+        matchup = simulate(selected_season, as_of, (tuple(selected_hitters), tuple(selected_pitchers)),
+                           (tuple(opponent_hitters), tuple(opponent_pitchers)), trials)
+        st.write(f"Your team wins {matchup.attrs['matchup_win']:.1%} of weeks "
+                 f"(ties {matchup.attrs['matchup_tie']:.1%}), "
+                 f"{matchup.attrs['expected_categories']:.1f} categories on average")
+        st.dataframe(matchup.style.format({
+            "Win %": "{:.1%}",
+            "Tie %": "{:.1%}",
+            "Loss %": "{:.1%}",
+        }), hide_index=True)
+
+    st.write("### Trade Analyzer")
+    my_hitters = hitter_z_scores_ranked[hitter_z_scores_ranked["Name"].isin(selected_hitters)]
+    my_pitchers = pitcher_z_scores_ranked[pitcher_z_scores_ranked["Name"].isin(selected_pitchers)]
+    their_hitters = hitter_z_scores_ranked[hitter_z_scores_ranked["Name"].isin(opponent_hitters)]
+    their_pitchers = pitcher_z_scores_ranked[pitcher_z_scores_ranked["Name"].isin(opponent_pitchers)]
+    my_names, my_z = roster_z(my_hitters, my_pitchers)
+    their_names, their_z = roster_z(their_hitters, their_pitchers)
+
+    if my_names and their_names:
+        send = st.multiselect("You send", range(len(my_names)), format_func=lambda row: my_names[row], key="trade_send")
+        receive = st.multiselect("You receive", range(len(their_names)), format_func=lambda row: their_names[row], key="trade_receive")
+
+        if send or receive:
+            st.dataframe(evaluate_trade(my_z, their_z, send, receive).style.format(precision=2), hide_index=True)
+
+            # Rows are hitters first, then pitchers, as roster_z stacks them
+            def after_trade(names, n_hitters, out_rows, other_names, other_n_hitters, in_rows):
+                keep = [row for row in range(len(names)) if row not in out_rows]
+                rows = [(names[row], row < n_hitters) for row in keep] + [(other_names[row], row < other_n_hitters) for row in in_rows]
+                return tuple(name for name, hitter in rows if hitter), tuple(name for name, hitter in rows if not hitter)
+
+            team_a = (tuple(selected_hitters), tuple(selected_pitchers))
+            team_b = (tuple(opponent_hitters), tuple(opponent_pitchers))
+            traded_a = after_trade(my_names, len(my_hitters), send, their_names, len(their_hitters), receive)
+            traded_b = after_trade(their_names, len(their_hitters), receive, my_names, len(my_hitters), send)
+            before = simulate(selected_season, as_of, team_a, team_b, trials)
+            after = simulate(selected_season, as_of, traded_a, traded_b, trials)
+            st.write(f"Simulated weekly win rate against this opponent: "
+                     f"{before.attrs['matchup_win']:.1%} → {after.attrs['matchup_win']:.1%}")
+
+        if st.checkbox("Find trades", key="trade_search"):
+            targets = st.multiselect("Categories you want to improve", CATEGORY_COLUMNS, default=CATEGORY_COLUMNS, key="trade_targets")
+            needs = [c for c, need in zip(CATEGORY_COLUMNS, category_needs(their_z)) if need]
+            their_targets = st.multiselect("Categories they want to improve", CATEGORY_COLUMNS, default=needs, key="trade_their_targets")
+            trades = batch_trades(my_z, their_z,
+                                  weights_a=[1.0 if c in targets else 0.0 for c in CATEGORY_COLUMNS],
+                                  weights_b=[1.0 if c in their_targets else 0.0 for c in CATEGORY_COLUMNS])
+            # Rank by the worse side's gain, so the top trades help both teams
+            best = trades.iloc[top_k(np.minimum(trades["A Gain"], trades["B Gain"]).to_numpy(), 10)]
+            names = lambda roster, first, second: roster[first] + (f" + {roster[second]}" if second >= 0 else "")
+            st.dataframe(pd.DataFrame({
+                "You Send": [names(my_names, a, b) for a, b in zip(best["A Sends 1"], best["A Sends 2"])],
+                "You Receive": [names(their_names, a, b) for a, b in zip(best["B Sends 1"], best["B Sends 2"])],
+                "Your Gain": best["A Gain"],
+                "Their Gain": best["B Gain"],
+                "Their Total Z Change": -best[CATEGORY_COLUMNS].sum(axis=1),
+            }).style.format(precision=2), hide_index=True)
+
+with tab5:
+    st.subheader("📝 Draft Assistant")
+    draft_teams = st.number_input("Teams in the draft", min_value=2, max_value=20, value=DEFAULT_TEAMS, key="draft_teams")
+
+    # One session per season/timeframe, as-of date and league size; picks survive reruns
+    draft_key = (selected_season, as_of, draft_teams)
+    if st.session_state.get("draft_key") != draft_key:
+        st.session_state["draft"] = DraftSession(hitter_z_scores_ranked, pitcher_z_scores_ranked, teams=draft_teams)
+        st.session_state["draft_key"] = draft_key
+    draft = st.session_state["draft"]
+
+    on_the_clock = draft.on_the_clock()
+    st.write(f"### Pick {len(draft.picks) + 1}: Team {on_the_clock + 1} is on the clock")
+    recommendations = draft.recommend(on_the_clock, k=10)
+    st.dataframe(recommendations.drop(columns="Player").style.format({
+        "Total Z-Score": "{:.2f}",
+        "VOR": "{:.2f}",
+        "Need Fit": "{:.2f}",
+    }), hide_index=True)
+
+    available = draft.players[draft.available]
+    labels = available["Name"] + " (" + available["Team"].astype(str) + ", " + available["Pos"].fillna("-").astype(str) + ")"
+    drafted = st.selectbox("Drafted player", available.index, format_func=lambda row: labels[row], key="draft_pick")
+    record_col, undo_col = st.columns(2)
+    if record_col.button("Record pick", key="draft_record") and drafted is not None:
+        try:
+            draft.pick(drafted)
+        except ValueError as e:
+            # No rerun on failure, it would clear the message before it is seen
+            st.error(f"❌ {e}")
+        else:
+            st.rerun()
+    if undo_col.button("Undo last pick", key="draft_undo"):
+        draft.undo()
+        st.rerun()
+
+    st.write("### Replacement Levels")
+    st.dataframe(draft.replacement_levels().style.format({"Replacement Level": "{:.2f}"}), hide_index=True)
+
+    if draft.picks:
+        st.write("### Draft Board")
+        st.dataframe(draft.draft_board().style.format({"Total Z-Score": "{:.2f}"}), hide_index=True)
@@ -0,0 +1,54 @@
+"""
+Z-score cell colors for the Streamlit tables. The thresholds live in one bin
+table; a whole frame is binned with np.digitize and handed to Styler.apply as a
+frame of CSS strings, instead of calling a Python function per cell.
+"""
+import numpy as np
+import pandas as pd
+
+# Lower edges of each color band, best first: a z-score >= 2.5 is dark green,
+# >= 1.5 green, and so on; anything below the last edge is dark red.
+Z_SCORE_BINS = [
+    (2.5, "#006400"),   # dark green
+    (1.5, "#008000"),   # green
+    (0.5, "#32CD32"),   # light green
+    (-0.5, "#FFFFFF"),  # white
+    (-1.5, "#FFA07A"),  # light red
+    (-2.5, "#FF0000"),  # red
+]
+BELOW_BINS = "#8B0000"  # dark red
+
+EDGES = np.array([edge for edge, _ in reversed(Z_SCORE_BINS)])
+STYLES = np.array([f"background-color: {color}; color: black;"
+                   for color in [BELOW_BINS] + [color for _, color in reversed(Z_SCORE_BINS)]] + [""])
+
+
+def z_score_css(frame, columns, rows=None):
+    """
+    CSS for every cell of frame[columns] (a frame of the same shape). NaN and
+    non-numeric cells, and rows outside the boolean mask `rows`, get no style.
+    """
+    values = frame[columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    bands = np.digitize(values, EDGES)
+    unstyled = np.isnan(values)
+    if rows is not None:
+        unstyled |= ~np.asarray(rows, dtype=bool)[:, None]
+    bands[unstyled] = len(STYLES) - 1
+    return pd.DataFrame(STYLES[bands], index=frame.index, columns=columns)
+
+
+def style_z_scores(frame, columns, css=None):
+    """
+    frame.style with the z-score colors applied in one vectorized step. Pass a
+    precomputed `css` (e.g. z_score_css over the whole ranked table, cached per
+    snapshot) to reuse it for any subset of its rows.
+    """
+    if css is None:
+        css = z_score_css(frame, columns)
+    styles = css.to_numpy()
+
+    def cell_css(cells):
+        picked = styles[np.ix_(css.index.get_indexer(cells.index), css.columns.get_indexer(cells.columns))]
+        return pd.DataFrame(picked, index=cells.index, columns=cells.columns)
+
+    return frame.style.apply(cell_css, axis=None, subset=columns)
@@ -0,0 +1,89 @@
+"""
+Trade evaluation on top of the ranked z-score tables. Every player's category
+z-scores were already standardized against the league when the snapshot was
+ranked, so a roster's category totals are the sum of its players' z vectors and
+a trade moves them by (players received - players sent): no league-wide
+re-ranking, just vector adds. batch_trades scores every 1-for-1, 2-for-1 and
+1-for-2 swap between two rosters in one broadcast.
+"""
+import numpy as np
+import pandas as pd
+
+from zscores import PITCHER_CATEGORIES, HITTER_CATEGORIES
+
+CATEGORY_COLUMNS = [spec.column for spec in HITTER_CATEGORIES + PITCHER_CATEGORIES]
+
+
+def roster_z(hitters_z, pitchers_z, columns=CATEGORY_COLUMNS):
+    """
+    One roster's players from the hitter and pitcher z-score tables as
+    (names, (players, categories) matrix); a hitter has 0 in pitching columns
+    and the reverse.
+    """
+    roster = pd.concat([hitters_z, pitchers_z], ignore_index=True)
+    z = roster.reindex(columns=columns).to_numpy(dtype=float, na_value=np.nan)
+    return roster['Name'].tolist(), np.nan_to_num(z)
+
+
+def evaluate_trade(z_a, z_b, give, get, columns=CATEGORY_COLUMNS):
+    """
+    Category z totals for teams A and B before and after A sends the rows
+    `give` of z_a for the rows `get` of z_b. One row per category plus Total.
+    """
+    moved = z_b[list(get)].sum(axis=0) - z_a[list(give)].sum(axis=0)
+    before_a, before_b = z_a.sum(axis=0), z_b.sum(axis=0)
+    table = pd.DataFrame({
+        'Category': columns,
+        'Team A Before': before_a, 'Team A After': before_a + moved, 'Team A Change': moved,
+        'Team B Before': before_b, 'Team B After': before_b - moved, 'Team B Change': -moved,
+    })
+    total = table.drop(columns='Category').sum().to_frame().T.assign(Category='Total')
+    return pd.concat([table, total[table.columns]], ignore_index=True)
+
+
+def category_needs(z):
+    """1 for the categories where a roster's z total is below its own average category, else 0."""
+    totals = z.sum(axis=0)
+    return (totals < totals.mean()).astype(float)
+
+
+def trade_sides(n):
+    """Every 1- and 2-player subset of n roster rows, as (first, second) with -1 for none."""
+    first, second = np.triu_indices(n, k=1)
+    return (np.concatenate([np.arange(n), first]),
+            np.concatenate([np.full(n, -1), second]))
+
+
+def side_sums(z, first, second):
+    return z[first] + np.where((second >= 0)[:, None], z[np.maximum(second, 0)], 0.0)
+
+
+def batch_trades(z_a, z_b, weights_a=None, weights_b=None, columns=CATEGORY_COLUMNS):
+    """
+    Every 1-for-1, 2-for-1 and 1-for-2 trade between rosters A and B, scored
+    in one vectorized pass. Gains weight each team's category change by
+    weights_a / weights_b (1 everywhere by default, where one side's gain is
+    the other's loss); weighting the categories each team needs lets both
+    sides come out ahead. Returns one row per trade with the row numbers sent
+    each way, both gains and A's change per category.
+    """
+    weights_a = np.ones(len(columns)) if weights_a is None else np.asarray(weights_a, dtype=float)
+    weights_b = np.ones(len(columns)) if weights_b is None else np.asarray(weights_b, dtype=float)
+    a_first, a_second = trade_sides(len(z_a))
+    b_first, b_second = trade_sides(len(z_b))
+    sent, received = side_sums(z_a, a_first, a_second), side_sums(z_b, b_first, b_second)
+
+    # Every (sent, received) pairing, dropping 2-for-2
+    give, get = np.meshgrid(np.arange(len(sent)), np.arange(len(received)), indexing='ij')
+    give, get = give.ravel(), get.ravel()
+    keep = (a_second[give] < 0) | (b_second[get] < 0)
+    give, get = give[keep], get[keep]
+
+    change = received[get] - sent[give]
+    trades = pd.DataFrame({
+        'A Sends 1': a_first[give], 'A Sends 2': a_second[give],
+        'B Sends 1': b_first[get], 'B Sends 2': b_second[get],
+        'A Gain': change @ weights_a, 'B Gain': -change @ weights_b,
+    })
+    trades[columns] = change
+    return trades
@@ -0,0 +1,307 @@
+"""
+The one z-score engine every front end ranks with (streamlit_app.py, app.py,
+backend_website.py, THEGOODCODE.ipynb.py). A category list says which columns
+count, which direction is better, and which rate stats are weighted by playing
+time; all categories are then standardized together as one float32 matrix.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class CategorySpec:
+    """One scoring category."""
+    column: str
+    higher_is_better: bool = True
+    # Playing-time column for rate stats (IP, PA): a rate over more innings or
+    # plate appearances moves the z-score further, then the column is re-standardized
+    weight: str = None
+
+
+PITCHER_CATEGORIES = (
+    CategorySpec('W'),
+    CategorySpec('ERA', higher_is_better=False, weight='IP'),
+    CategorySpec('WHIP', higher_is_better=False, weight='IP'),
+    CategorySpec('SO'),
+    CategorySpec('SV'),
+    CategorySpec('HLD'),
+)
+HITTER_CATEGORIES = (
+    CategorySpec('R'),
+    CategorySpec('HR'),
+    CategorySpec('RBI'),
+    CategorySpec('SB'),
+    CategorySpec('AVG', weight='PA'),
+)
+# Rows need playing time in this column to be ranked at all
+PITCHER_VOLUME = 'IP'
+HITTER_VOLUME = 'PA'
+ID_COLUMNS = ['Name', 'Team', 'Pos']
+
+
+def standardize(values):
+    """Column-wise (x - mean) / std (sample std, NaN-skipping, like pandas)."""
+    mean = np.nanmean(values, axis=0)
+    std = np.nanstd(values, axis=0, ddof=1)
+    return (values - mean) / std
+
+
+def zscore_matrix(values, weights, categories):
+    """
+    values: (players, categories) float32. weights: same shape, the playing
+    time for weighted categories (ignored elsewhere). Returns the z matrix with
+    lower-is-better categories already flipped.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = standardize(values)
+        weighted = np.array([spec.weight is not None for spec in categories])
+        if weighted.any():
+            # (x - mean) / (std / sqrt(w)) is z * sqrt(w); re-standardize those columns
+            z[:, weighted] = standardize(z[:, weighted] * np.sqrt(weights[:, weighted]))
+    signs = np.array([1 if spec.higher_is_better else -1 for spec in categories], dtype=np.float32)
+    return z * signs
+
+
+def zscore_table(data, categories, volume, id_columns=ID_COLUMNS):
+    """
+    One row per player with data[volume] > 0: the id columns, one z-score per
+    category and Total Z-Score. Rows keep data's index labels, so the result
+    aligns back onto data without a join.
+    """
+    columns = [spec.column for spec in categories]
+    weight_columns = [spec.weight or spec.column for spec in categories]
+    # Narrow to the columns used before filtering rows; stats frames run to ~400 columns
+    needed = list(dict.fromkeys(list(id_columns) + columns + weight_columns))
+    players = data[needed][pd.to_numeric(data[volume], errors='coerce') > 0]
+    values = players[columns].to_numpy(dtype=np.float32, na_value=np.nan)
+    weights = players[weight_columns].to_numpy(dtype=np.float32, na_value=np.nan)
+
+    z = zscore_matrix(values, weights, categories)
+    table = players[list(id_columns)].copy()
+    table[columns] = z
+    # Missing categories count as zero, as pandas' sum(axis=1) did
+    table['Total Z-Score'] = np.nansum(z, axis=1)
+    return table
+
+
+def ranked(z_scores):
+    """Sort by Total Z-Score, best first, and number the rows in a leading Rank column."""
+    z_scores_ranked = z_scores.sort_values(by='Total Z-Score', ascending=False, kind='stable')
+    z_scores_ranked.insert(0, 'Rank', np.arange(1, len(z_scores_ranked) + 1))
+    return z_scores_ranked
+
+
+# Below this many rows a full stable argsort is as fast as partitioning first
+SELECT_MIN_ROWS = 1000
+
+
+def sort_keys(values, ascending=False):
+    """Ascending sort keys that put the best value first and NaN last."""
+    keys = values if ascending else -values
+    return np.where(np.isnan(keys), np.inf, keys)
+
+
+def select_top(keys, k, rows):
+    """The k rows with the smallest keys, in key order (ties by row order, as a stable sort)."""
+    if k <= 0:
+        return rows[:0]
+    if k >= len(rows) or len(rows) < SELECT_MIN_ROWS:
+        return rows[np.argsort(keys[rows], kind='stable')][:k]
+    row_keys = keys[rows]
+    kth = np.partition(row_keys, k - 1)[k - 1]
+    ahead = np.flatnonzero(row_keys < kth)
+    tied = np.flatnonzero(row_keys == kth)[:k - len(ahead)]
+    picked = np.sort(np.concatenate([ahead, tied]))
+    return rows[picked[np.argsort(row_keys[picked], kind='stable')]]
+
+
+def top_k(values, k, rows=None, ascending=False):
+    """
+    Positions of the k best values among `rows` (all of `values` if None), best
+    first, without sorting the rest: one partition finds the k-th value, then
+    only the k picked rows are sorted. NaN ranks last and ties keep row order,
+    so the result is the head of a stable sort.
+    """
+    rows = np.arange(len(values)) if rows is None else np.asarray(rows)
+    return select_top(sort_keys(values, ascending), k, rows)
+
+
+def slice_rows(frame, slice_by=('Pos', 'Team')):
+    """Row positions of every slice: ('all', None), then (column.lower(), value) per value of each column."""
+    slices = {('all', None): np.arange(len(frame))}
+    for column in slice_by:
+        for value, rows in frame.groupby(column, observed=True).indices.items():
+            slices[(column.lower(), value)] = rows
+    return slices
+
+
+def top_k_slices(frame, columns, k, slices, ascending=False):
+    """Top-k row positions for every (sort column, slice) pair in one call, keyed like that."""
+    order = {}
+    for column in columns:
+        keys = sort_keys(frame[column].to_numpy(dtype=float, na_value=np.nan), ascending)
+        for key, rows in slices.items():
+            order[(column, key)] = select_top(keys, k, rows)
+    return order
+
+
+# Rows of RunningZScores.moments. Plain categories use the first three; weighted
+# ones also need the weight-mixed sums, since z * sqrt(w) is re-standardized.
+MOMENTS = ['n', 'sum', 'sum_sq', 'n_w', 'sum_x_rw', 'sum_rw', 'sum_sq_w', 'sum_x_w', 'sum_w']
+
+
+def moment_sums(values, weights):
+    """Sufficient statistics contributed by a block of rows, one column per category."""
+    present = np.isfinite(values)
+    x = np.where(present, values, 0.0)
+    paired = present & np.isfinite(weights) & (weights >= 0)
+    w = np.where(paired, weights, 0.0)
+    xp = np.where(paired, x, 0.0)
+    rw = np.sqrt(w)
+    return np.array([
+        present.sum(axis=0), x.sum(axis=0), (x * x).sum(axis=0),
+        paired.sum(axis=0), (xp * rw).sum(axis=0), rw.sum(axis=0),
+        (xp * xp * w).sum(axis=0), (xp * w).sum(axis=0), w.sum(axis=0),
+    ], dtype=np.float64)
+
+
+class RunningZScores:
+    """
+    zscore_table for a player pool that changes a few rows at a time. Each
+    player's category values sit in a fixed slot and the pool's moments are
+    kept as running sums, so apply()/remove() cost O(changed players); z-scores
+    are only re-derived from the moments when table() is read.
+    """
+
+    def __init__(self, data, categories, volume, key='IDfg', id_columns=ID_COLUMNS):
+        self.categories = tuple(categories)
+        self.volume = volume
+        self.key = key
+        self.id_columns = list(id_columns)
+        self.columns = [spec.column for spec in self.categories]
+        self.weight_columns = [spec.weight or spec.column for spec in self.categories]
+        self.weighted = np.array([spec.weight is not None for spec in self.categories])
+        self.signs = np.array([1 if spec.higher_is_better else -1 for spec in self.categories])
+
+        width = len(self.categories)
+        self.keys = pd.Index(data[key].iloc[:0])
+        self.values = np.empty((0, width))
+        self.weights = np.empty((0, width))
+        self.volumes = np.empty(0)
+        self.active = np.empty(0, dtype=bool)
+        self.moments = np.zeros((len(MOMENTS), width))
+        self.info = data.iloc[:0].set_index(key, drop=False)[self.id_columns]
+        self._info_updates = []
+        self._table = None
+        self.apply(data)
+
+    def _arrays(self, data):
+        keys = pd.Index(data[self.key])
+        if keys.hasnans or keys.has_duplicates:
+            raise ValueError(f"{self.key} must be present and unique for every player")
+        return (keys,
+                data[self.columns].to_numpy(dtype=np.float64, na_value=np.nan),
+                data[self.weight_columns].to_numpy(dtype=np.float64, na_value=np.nan),
+                pd.to_numeric(data[self.volume], errors='coerce').to_numpy(dtype=np.float64))
+
+    def _pool_sums(self, slots):
+        """Moments contributed by these slots, counting only active players with volume > 0."""
+        slots = slots[self.active[slots] & (self.volumes[slots] > 0)]
+        return moment_sums(self.values[slots], self.weights[slots])
+
+    def _write(self, keys, values, weights, volumes):
+        slots = self.keys.get_indexer(keys)
+        known = slots >= 0
+        self.moments -= self._pool_sums(slots[known])
+        self.values[slots[known]] = values[known]
+        self.weights[slots[known]] = weights[known]
+        self.volumes[slots[known]] = volumes[known]
+        self.active[slots[known]] = True
+        if not known.all():
+            start = len(self.keys)
+            self.keys = self.keys.append(keys[~known])
+            self.values = np.vstack([self.values, values[~known]])
+            self.weights = np.vstack([self.weights, weights[~known]])
+            self.volumes = np.concatenate([self.volumes, volumes[~known]])
+            self.active = np.concatenate([self.active, np.ones((~known).sum(), dtype=bool)])
+            slots[~known] = np.arange(start, len(self.keys))
+        self.moments += self._pool_sums(slots)
+        self._table = None
+
+    def apply(self, changes):
+        """Fold in new or updated rows for a batch of players (matched on key)."""
+        if len(changes) == 0:
+            return
+        self._write(*self._arrays(changes))
+        self._info_updates.append(changes.set_index(self.key, drop=False)[self.id_columns])
+
+    def remove(self, keys):
+        """Take players out of the pool entirely."""
+        slots = self.keys.get_indexer(pd.Index(keys))
+        slots = slots[slots >= 0]
+        self.moments -= self._pool_sums(slots)
+        self.active[slots] = False
+        self._table = None
+
+    def sync(self, data):
+        """
+        Bring the pool in line with a full refresh of `data`, folding in only the
+        rows that were added, changed or dropped. Returns how many players moved.
+        """
+        keys, values, weights, volumes = self._arrays(data)
+        slots = self.keys.get_indexer(keys)
+        known = slots >= 0
+        same = np.zeros(len(keys), dtype=bool)
+        old = slots[known]
+        same_value = lambda a, b: (a == b) | (np.isnan(a) & np.isnan(b))
+        same[known] = (self.active[old]
+                       & same_value(self.values[old], values[known]).all(axis=1)
+                       & same_value(self.weights[old], weights[known]).all(axis=1)
+                       & same_value(self.volumes[old], volumes[known]))
+        changed = ~same
+        self._write(keys[changed], values[changed], weights[changed], volumes[changed])
+
+        dropped = self.active.copy()
+        dropped[self.keys.get_indexer(keys)] = False
+        self.remove(self.keys[dropped])
+
+        # Names, teams and positions don't feed the moments; take them wholesale
+        info = data.set_index(self.key, drop=False)[self.id_columns]
+        self.table()  # fold pending apply() batches into self.info before comparing
+        old_info = self.info.reindex(info.index)
+        relabeled = (old_info.ne(info) & ~(old_info.isna() & info.isna())).any(axis=1).to_numpy()
+        self.info = info
+        self._table = None
+        return int((changed | relabeled).sum() + dropped.sum())
+
+    def table(self):
+        """Same shape as zscore_table, indexed by key; cached until the next change."""
+        if self._table is not None:
+            return self._table
+        if self._info_updates:
+            info = pd.concat([self.info] + self._info_updates)
+            self.info = info[~info.index.duplicated(keep='last')]
+            self._info_updates = []
+
+        pool = self.active & (self.volumes > 0)
+        values, weights = self.values[pool], self.weights[pool]
+        n, total, total_sq, n_w, x_rw, rw, sq_w, x_w, w = self.moments
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = total / n
+            std = np.sqrt((total_sq - total * mean) / (n - 1))
+            z = (values - mean) / std
+            # Re-standardizing (x - mean) / std * sqrt(w) cancels std, leaving
+            # (x - mean) * sqrt(w) against its own mean and spread
+            shifted_sum = x_rw - mean * rw
+            shifted_sq = sq_w - 2 * mean * x_w + mean * mean * w
+            weighted_std = np.sqrt((shifted_sq - shifted_sum ** 2 / n_w) / (n_w - 1))
+            weighted_z = ((values - mean) * np.sqrt(weights) - shifted_sum / n_w) / weighted_std
+        z = (np.where(self.weighted, weighted_z, z) * self.signs).astype(np.float32)
+
+        table = self.info.reindex(self.keys[pool])
+        table[self.columns] = z
+        table['Total Z-Score'] = np.nansum(z, axis=1)
+        self._table = table
+        return table